@@ -100,16 +100,50 @@ Data sources:
 """
 
 import argparse
+import json
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 
-import deims
 import requests
 
 from ucgrassland import utils as ut
 from ucgrassland.get_wekeo_data import request_hda_grassland_data
 from ucgrassland.logger_config import logger
 
+# Accepted eunis EEA habitat types: E, E1, E2, E3, E4, E5 (and subtypes), as label in last brackets
+# not included:
+# E6 : Inland salt steppes
+# E7 : Sparsely wooded grasslands
+EUNIS_GRASS_LABEL_PATTERN = re.compile(r"(?:^|\()\)*(?:E|E[1-5][^(]*?)\)*$")
+
+# HRL Grassland 2018 image service and classification of raster values
+HRL_GRASSLAND_URL = "https://image.discomap.eea.europa.eu/arcgis/rest/services/GioLandPublic/HRL_Grassland_2018/ImageServer"
+HRL_GRASSLAND_CATEGORIES = MappingProxyType(
+    {
+        "0": "non-grassland",
+        "1": "grassland",
+        "254": "unclassifiable (no satellite image available, clouds, shadows or snow)",
+        "255": "outside area",
+    }
+)
+
+# Accepted land cover map categories (lower case), not included: "legumes"
+GRASS_CATEGORIES = frozenset(
+    {
+        "grassland",
+        "grass",
+        "permanent grassland",
+        "cultivated grassland",
+        "fallow land",
+        "bare land",
+    }
+)
+
 
 def get_map_specs(map_key):
     """
@@ -257,17 +291,17 @@ def get_map_and_legend(map_key, *, cache=None):
     return map_file, category_mapping
 
 
-def get_category_tif(map_file, category_mapping, location):
+def get_categories_tif(map_file, category_mapping, locations):
     """
-    Get the category based on the raster value at the specified location.
+    Get the categories based on the raster values at multiple locations, reading the raster only once.
 
     Parameters:
         map_file (Path): Path to the raster file.
         category_mapping (dict): Mapping of raster values to categories.
-        location (dict): Dictionary with 'lat' and 'lon' keys for extracting raster value.
+        locations (list): List of dictionaries with 'lat' and 'lon' keys for extracting raster values.
 
     Returns:
-         tuple: Category (str) corresponding to the raster value at the specified location,
+         list of tuple: Category (str) corresponding to the raster value at each location,
              or "unknown category" if the value is not found in the mapping, and time stamp.
     """
     # Set no_data_value if "outside area" exists in category_mapping
@@ -276,21 +310,42 @@ def get_category_tif(map_file, category_mapping, location):
         None,
     )
 
-    value, time_stamp = ut.extract_raster_value(
-        map_file, location, no_data_value=no_data_value
+    values, time_stamp = ut.extract_raster_values(
+        map_file, locations, no_data_value=no_data_value
     )
-    category = category_mapping.get(value, "unknown category")
+    categories = []
 
-    if category == "unknown category":
-        logger.warning(
-            f"Location {location['lat']}, {location['lon']} has unknown category value ({value})."
-        )
-    elif category == "outside area":
-        logger.warning(
-            f"Location {location['lat']}, {location['lon']} is outside the area of the map '{map_file}'."
-        )
+    for location, value in zip(locations, values):
+        category = category_mapping.get(value, "unknown category")
+
+        if category == "unknown category":
+            logger.warning(
+                f"Location {location['lat']}, {location['lon']} has unknown category value ({value})."
+            )
+        elif category == "outside area":
+            logger.warning(
+                f"Location {location['lat']}, {location['lon']} is outside the area of the map '{map_file}'."
+            )
+
+        categories.append((category, time_stamp))
 
-    return category, time_stamp
+    return categories
+
+
+def get_category_tif(map_file, category_mapping, location):
+    """
+    Get the category based on the raster value at the specified location.
+
+    Parameters:
+        map_file (Path): Path to the raster file.
+        category_mapping (dict): Mapping of raster values to categories.
+        location (dict): Dictionary with 'lat' and 'lon' keys for extracting raster value.
+
+    Returns:
+         tuple: Category (str) corresponding to the raster value at the specified location,
+             or "unknown category" if the value is not found in the mapping, and time stamp.
+    """
+    return get_categories_tif(map_file, category_mapping, [location])[0]
 
 
 def get_category_deims(location):
@@ -308,7 +363,7 @@ def get_category_deims(location):
         categories = []
 
         try:
-            location_record = deims.getSiteById(location["deims_id"])
+            location_record = ut.get_deims_site_record(location["deims_id"])
             eunis_habitats = (
                 location_record.get("attributes", {})
                 .get("environmentalCharacteristics", {})
@@ -350,16 +405,20 @@ def get_category_hrl_grassland(location):
         tuple: Category (str) as classified if found (e.g. 'grassland', 'non-grassland'), and time stamp.
     """
     # Define URL and request
-    url = "https://image.discomap.eea.europa.eu/arcgis/rest/services/GioLandPublic/HRL_Grassland_2018/ImageServer"
+    url = HRL_GRASSLAND_URL
 
     # # test for CORINE
     # # params unclear
     # url = "https://image.discomap.eea.europa.eu/arcgis/rest/services/Corine/CLC2018_WM/MapServer"
 
+    # Send coordinates in native CRS of the HRL raster (ETRS89 / LAEA Europe)
+    east, north = ut.reproject_coordinates(
+        location["lat"], location["lon"], "EPSG:3035"
+    )
     geometry = {
-        "x": location["lon"],
-        "y": location["lat"],
-        "spatialReference": {"wkid": 4326},
+        "x": east,
+        "y": north,
+        "spatialReference": {"wkid": 3035},
     }
     params = {
         "geometry": str(geometry),
@@ -372,26 +431,19 @@ def get_category_hrl_grassland(location):
     time_stamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
     try:
-        response = requests.get(f"{url}/identify", params=params, timeout=30)
+        response = ut.get_http_session().get(
+            f"{url}/identify", params=params, timeout=30
+        )
         response.raise_for_status()  # Raises HTTPError for bad status codes (4xx, 5xx)
 
-        data = response.json()
+        data = ut.parse_json(response.content)
 
         if "value" in data:
             value = data["value"]
 
             # Return classification based on value
-            if value == "0":
-                return "non-grassland", time_stamp
-            if value == "1":
-                return "grassland", time_stamp
-            if value == "254":
-                return (
-                    "unclassifiable (no satellite image available, clouds, shadows or snow)",
-                    time_stamp,
-                )
-            if value == "255":
-                return "outside area", time_stamp
+            if value in HRL_GRASSLAND_CATEGORIES:
+                return HRL_GRASSLAND_CATEGORIES[value], time_stamp
 
             # Handle unknown values
             logger.error(f"Unknown value for specified location: {value}.")
@@ -399,7 +451,7 @@ def get_category_hrl_grassland(location):
         else:
             logger.error("No value for specified location in response.")
 
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError) as e:
         logger.error(
             f"Request failed for location ({location['lat']}, {location['lon']}): {e}"
         )
@@ -407,24 +459,115 @@ def get_category_hrl_grassland(location):
     return None, time_stamp
 
 
+def get_categories_hrl_grassland(locations, *, batch_size=200, max_workers=8):
+    """
+    Get categories based on HRL Grassland raster at multiple locations, with one request per batch of locations.
+
+    Parameters:
+        locations (list of dict): Dictionaries with 'lat' and 'lon' keys for extracting raster values.
+        batch_size (int): Maximum number of locations per request (default is 200).
+        max_workers (int): Maximum number of parallel single location requests (default is 8).
+
+    Returns:
+        list of tuple: Category (str) as classified if found (e.g. 'grassland', 'non-grassland'), and time stamp,
+            for each location.
+    """
+    categories = [None] * len(locations)
+
+    for batch_start in range(0, len(locations), batch_size):
+        batch_locations = locations[batch_start : batch_start + batch_size]
+
+        # Send all coordinates as one multipoint in native CRS of the HRL raster (ETRS89 / LAEA Europe)
+        east, north = ut.reproject_coordinates(
+            [location["lat"] for location in batch_locations],
+            [location["lon"] for location in batch_locations],
+            "EPSG:3035",
+        )
+        geometry = {
+            "points": [[float(x), float(y)] for x, y in zip(east, north)],
+            "spatialReference": {"wkid": 3035},
+        }
+        params = {
+            "geometry": str(geometry),
+            "geometryType": "esriGeometryMultipoint",
+            "returnFirstValueOnly": "true",
+            "f": "json",
+        }
+        time_stamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+        try:
+            # Send parameters as form data, a multipoint geometry can exceed URL length limits
+            response = ut.get_http_session().post(
+                f"{HRL_GRASSLAND_URL}/getSamples", data=params, timeout=60
+            )
+            response.raise_for_status()
+            samples = ut.parse_json(response.content).get("samples", [])
+        except (requests.RequestException, ValueError) as e:
+            logger.error(
+                f"Batch request failed for {len(batch_locations)} locations: {e}"
+            )
+            samples = []
+
+        for sample in samples:
+            location_index = batch_start + sample.get("locationId", -1)
+
+            if batch_start <= location_index < batch_start + len(batch_locations):
+                value = str(sample.get("value"))
+
+                # Keep unknown values (e.g. 'NoData') unset, to be requested for single location
+                if value in HRL_GRASSLAND_CATEGORIES:
+                    categories[location_index] = (
+                        HRL_GRASSLAND_CATEGORIES[value],
+                        time_stamp,
+                    )
+
+    # Request single locations without known value from batch requests
+    missing_indices = [
+        index for index, category in enumerate(categories) if category is None
+    ]
+
+    if missing_indices:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for index, category in zip(
+                missing_indices,
+                executor.map(
+                    get_category_hrl_grassland,
+                    [locations[index] for index in missing_indices],
+                ),
+            ):
+                categories[index] = category
+
+    return categories
+
+
 def check_desired_categories(
-    category, target_categories, location, map_key, *, skip_logging=True
+    category,
+    target_categories,
+    location,
+    map_key,
+    *,
+    skip_logging=True,
+    ignore_case=False,
 ):
     """
     Check if the given category is one of the target categories.
 
     Parameters:
         category (str): Category to check.
-        target_categories (list): List of target categories to compare against.
+        target_categories (list or set): Target categories to compare against (lower case if ignore_case).
         location (dict): Dictionary with 'lat' and 'lon' keys.
         map_key(str): Identifier of the map used for obtaining the category.
         skip_logging (bool): Whether to skip logging (default is False).
+        ignore_case (bool): Whether to compare category in lower case (default is False).
 
     Returns:
         bool: True if the category is in the target categories, False otherwise.
     """
     # Check if extracted categories are in any of the target categories
-    is_target_categories = category in target_categories
+    if ignore_case and isinstance(category, str):
+        is_target_categories = category.casefold().strip() in target_categories
+    else:
+        is_target_categories = category in target_categories
 
     # Log check results
     if not skip_logging:
@@ -455,20 +598,9 @@ def check_if_grassland(category, location, map_key):
         bool: True if the category represents grassland, False otherwise.
     """
     if map_key == "EUR_eunis_habitat":
-        # Set accepted eunis EEA habitat types
-        grass_labels = ["E", "E1", "E2", "E3", "E4", "E5"]
-        # not included:
-        # E6 : Inland salt steppes
-        # E7 : Sparsely wooded grasslands
-        habitat_label = category.split("(")[-1].strip(")")
-        is_grassland = habitat_label == grass_labels[0]
-
-        if not is_grassland:
-            # Check if any element in the reference list is a prefix of part_in_brackets
-            for label in grass_labels[1:]:
-                if habitat_label.startswith(label):
-                    is_grassland = True
-                    break
+        is_grassland = EUNIS_GRASS_LABEL_PATTERN.search(category) is not None
+
+        return is_grassland
     else:
         is_unknown = check_desired_categories(
             category, ["outside area", "unknown category"], location, map_key
@@ -477,18 +609,13 @@ def check_if_grassland(category, location, map_key):
         if is_unknown:
             return None
         else:
-            # Set accepted categories, not included: # "Legumes"
-            grass_categories = [
-                "Grassland",
-                "grassland",
-                "grass",
-                "Permanent grassland",
-                "Cultivated grassland",
-                "Fallow land",
-                "Bare land",
-            ]
             is_grassland = check_desired_categories(
-                category, grass_categories, location, map_key, skip_logging=False
+                category,
+                GRASS_CATEGORIES,
+                location,
+                map_key,
+                skip_logging=False,
+                ignore_case=True,
             )
 
             return is_grassland
@@ -517,7 +644,67 @@ def check_results_to_file(grassland_check, *, file_name=None, map_key=None):
     ut.list_to_file(grassland_check, file_name, column_names=column_names)
 
 
-def check_locations_for_grassland(locations, map_key, file_name=None):
+def read_cached_check_results(cache_file, map_key):
+    """
+    Read grassland check results of a map from a local SQLite cache file.
+
+    Parameters:
+        cache_file (str or Path): SQLite file with cached check results.
+        map_key (str): Identifier of the map to be used.
+
+    Returns:
+        dict: Lists of check results (without location info) per rounded coordinates tuple (lat, lon).
+    """
+    if not Path(cache_file).is_file():
+        return {}
+
+    with closing(sqlite3.connect(cache_file, timeout=30)) as connection:
+        rows = connection.execute(
+            "SELECT lat, lon, result_json FROM grass_checks WHERE map_key = ?",
+            (map_key,),
+        ).fetchall()
+
+    return {(lat, lon): json.loads(result_json) for lat, lon, result_json in rows}
+
+
+def write_cached_check_results(cache_file, map_key, check_results_per_location):
+    """
+    Write grassland check results of a map to a local SQLite cache file.
+
+    Parameters:
+        cache_file (str or Path): SQLite file with cached check results.
+        map_key (str): Identifier of the map to be used.
+        check_results_per_location (dict): Lists of check results (without location info) per
+            rounded coordinates tuple (lat, lon).
+    """
+    # Only keep definite results, missing maps or failed requests should be checked again
+    rows = [
+        (lat, lon, map_key, json.dumps(check_results, default=str))
+        for (lat, lon), check_results in check_results_per_location.items()
+        if check_results
+        and all(isinstance(check["is_grass"], bool) for check in check_results)
+    ]
+
+    if rows:
+        Path(cache_file).parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(sqlite3.connect(cache_file, timeout=30)) as connection:
+            # Maps are checked in parallel threads, let readers and the writer not block each other
+            connection.execute("PRAGMA journal_mode=WAL")
+
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS grass_checks (lat REAL, lon REAL, map_key TEXT, "
+                    "result_json TEXT, PRIMARY KEY (lat, lon, map_key))"
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO grass_checks VALUES (?, ?, ?, ?)", rows
+                )
+
+
+def check_locations_for_grassland(
+    locations, map_key, file_name=None, *, cache_file=None, max_workers=8
+):
     """
     Check if given locations correspond to grassland areas based on the provided land cover map.
 
@@ -525,6 +712,9 @@ def check_locations_for_grassland(locations, map_key, file_name=None):
         locations (list): List of location dictionaries containing coordinates ('lat', 'lon'), may also contain DEIMS.iD ('deims_id').
         map_key (str): Identifier of the map to be used.
         file_name (str or Path): File name to save check results (no file will be created otherwise).
+        cache_file (str or Path): SQLite file to reuse and store check results per coordinates,
+            not used for DEIMS habitat maps (default is None, no cache used).
+        max_workers (int): Maximum number of parallel requests (default is 8).
 
     Returns:
         list of dict: List of dicioniaries containing the check results for each location.
@@ -564,6 +754,48 @@ def check_locations_for_grassland(locations, map_key, file_name=None):
         "site_code",
     ]
 
+    def _get_location_key(location):
+        # DEIMS habitats are checked per site, all other maps per coordinates (~1 m precision)
+        if map_key in deims_keys:
+            return location.get("deims_id")
+
+        return round(location["lat"], 5), round(location["lon"], 5)
+
+    # Check each unique location only once, reuse results for duplicates
+    check_results_per_location = {}
+    unique_locations = {}
+
+    if cache_file and map_key not in deims_keys:
+        check_results_per_location.update(
+            read_cached_check_results(cache_file, map_key)
+        )
+        cached_location_keys = set(check_results_per_location)
+    else:
+        cache_file = None
+
+    for location in locations:
+        if "lat" in location and "lon" in location:
+            location_key = _get_location_key(location)
+
+            if location_key not in check_results_per_location:
+                unique_locations.setdefault(location_key, location)
+
+    if map_key in tif_keys and unique_locations:
+        # Read raster values for all (not cached) locations at once
+        map_file, category_mapping = get_map_and_legend(map_key)
+        tif_categories = iter(
+            get_categories_tif(
+                map_file, category_mapping, list(unique_locations.values())
+            )
+        )
+    elif map_key in hrl_keys and unique_locations:
+        # Request values for all (not cached) locations at once
+        hrl_categories = iter(
+            get_categories_hrl_grassland(
+                list(unique_locations.values()), max_workers=max_workers
+            )
+        )
+
     for location in locations:
         if "lat" in location and "lon" in location:
             site_check = {
@@ -571,6 +803,16 @@ def check_locations_for_grassland(locations, map_key, file_name=None):
             }
             map_specs = get_map_specs(map_key)
             site_check.update(map_year=map_specs["map_year"], map_key=map_key)
+            location_key = _get_location_key(location)
+
+            if location_key in check_results_per_location:
+                for check_result in check_results_per_location[location_key]:
+                    grassland_check.append({**site_check, **check_result})
+
+                continue
+
+            checks_done = len(grassland_check)
+            location_check_keys = set(site_check)
 
             if map_key in deims_keys:
                 if "deims_id" in site_check:
@@ -581,13 +823,12 @@ def check_locations_for_grassland(locations, map_key, file_name=None):
                             f"https://deims.org/api/sites/{site_check['deims_id']}"
                         )
                         all_categories, time_stamp = get_category_deims(site_check)
-                        is_grass = False
-
-                        for category in all_categories:
-                            is_grass = check_if_grassland(category, site_check, map_key)
 
-                            if is_grass:
-                                break
+                        # Stop checking as soon as one habitat is classified as grassland
+                        is_grass = any(
+                            check_if_grassland(category, site_check, map_key)
+                            for category in all_categories
+                        )
 
                         site_check.update(
                             lat=deims_info["lat"],  # replace with deims coord.
@@ -635,10 +876,7 @@ def check_locations_for_grassland(locations, map_key, file_name=None):
 
                 grassland_check.append(site_check)
             elif map_key in tif_keys:
-                map_file, category_mapping = get_map_and_legend(map_key)
-                category, time_stamp = get_category_tif(
-                    map_file, category_mapping, site_check
-                )
+                category, time_stamp = next(tif_categories)
                 is_grass = check_if_grassland(category, site_check, map_key)
                 site_check.update(
                     map_source=map_file,
@@ -648,8 +886,8 @@ def check_locations_for_grassland(locations, map_key, file_name=None):
                 )
                 grassland_check.append(site_check)
             elif map_key in hrl_keys:
-                map_source = "https://image.discomap.eea.europa.eu/arcgis/rest/services/GioLandPublic/HRL_Grassland_2018/ImageServer"
-                category, time_stamp = get_category_hrl_grassland(site_check)
+                map_source = HRL_GRASSLAND_URL
+                category, time_stamp = next(hrl_categories)
                 is_grass = check_if_grassland(category, site_check, map_key)
                 site_check.update(
                     map_source=map_source,
@@ -708,6 +946,18 @@ def check_locations_for_grassland(locations, map_key, file_name=None):
                             )
                             grassland_check.append(site_check)
                             break
+                    else:
+                        # Keep one check result per location, also if no map gives a valid category
+                        time_stamp = datetime.now(timezone.utc).isoformat(
+                            timespec="seconds"
+                        )
+                        site_check.update(
+                            map_source="",
+                            map_query_time_stamp=time_stamp,
+                            is_grass=None,
+                            category="Map not found!",
+                        )
+                        grassland_check.append(site_check)
             else:
                 try:
                     raise ValueError(
@@ -716,6 +966,17 @@ def check_locations_for_grassland(locations, map_key, file_name=None):
                 except ValueError as e:
                     logger.error(e)
                     raise
+
+            # Keep check results for duplicates (coordinates only if replaced, i.e. from DEIMS)
+            check_results_per_location[location_key] = [
+                {
+                    key: value
+                    for key, value in check.items()
+                    if key not in location_check_keys
+                    or (key in ["lat", "lon"] and map_key in deims_keys)
+                }
+                for check in grassland_check[checks_done:]
+            ]
         else:
             try:
                 raise ValueError(
@@ -725,6 +986,18 @@ def check_locations_for_grassland(locations, map_key, file_name=None):
                 logger.error(e)
                 raise
 
+    # Store new results in cache
+    if cache_file:
+        write_cached_check_results(
+            cache_file,
+            map_key,
+            {
+                location_key: check_results
+                for location_key, check_results in check_results_per_location.items()
+                if location_key not in cached_location_keys
+            },
+        )
+
     # Save results to file
     if file_name:
         check_results_to_file(grassland_check, file_name=file_name, map_key=map_key)
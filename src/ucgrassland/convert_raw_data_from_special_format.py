@@ -35,9 +35,12 @@ import numpy as np
 import pandas as pd
 from dotenv import dotenv_values
 
+from ucgrassland import utils as ut
 from ucgrassland.assign_pfts import get_gbif_family
 from ucgrassland.logger_config import logger
 
+CSV_CHUNK_SIZE = 100_000  # number of rows written per block for large output files
+
 
 def convert_raw_data_MAM_C():
     """
@@ -51,48 +54,53 @@ def convert_raw_data_MAM_C():
     file_name = "FEM_Revised.xlsx"
 
     # Read data from xls file
-    raw_data = pd.read_excel(source_folder / file_name, sheet_name="DATA_COL")
-    new_rows = []
-
-    # For each row in raw_data, extract the column entries with general information
-    for _, row in raw_data.iterrows():
-        site_code = row["SITE_CODE"]
-        station_code = row["STATION_CODE"]
-        vert_offset = row["VERT_OFFSET"]
-        time = row["TIME"]
-
-        if pd.isna(vert_offset):
-            vert_offset = "NA"
-
-        # Extract values for each species column (E to end)
-        for column in raw_data.columns[4:]:
-            column_name = column
-            column_value = row[column]
+    raw_data = pd.read_excel(
+        source_folder / file_name, sheet_name="DATA_COL", engine=ut.EXCEL_ENGINE
+    )
 
-            # Add new row if column value is finite and greater than 0
-            if pd.notna(column_value) and column_value > 0:
-                column_name = column_name.replace("Ã‚Â", "")
-                column_name = column_name.replace("Â", "")
-                column_name = column_name.replace("Ã", "")
-                column_name = column_name.replace("\xa0", " ")
-                column_name = column_name.strip()
-                new_rows.append(
-                    {
-                        "SITE_CODE": site_code,
-                        "STATION_CODE": station_code,
-                        "VERT_OFFSET": vert_offset,
-                        "VARIABLE": "Cover",
-                        "TIME": time,
-                        "TAXA": column_name,
-                        "VALUE": column_value,
-                        "UNIT": "%",
-                    }
-                )
+    # Convert from wide (one column per species, E to end) to long format,
+    # keep row-wise order of original entries
+    new_data = raw_data.melt(
+        id_vars=["SITE_CODE", "STATION_CODE", "VERT_OFFSET", "TIME"],
+        value_vars=raw_data.columns[4:],
+        var_name="TAXA",
+        value_name="VALUE",
+        ignore_index=False,
+    ).sort_index(kind="stable")
+
+    # Only keep entries if value is finite and greater than 0
+    new_data = new_data[new_data["VALUE"].notna() & (new_data["VALUE"] > 0)]
+
+    # Clean species names from encoding artefacts
+    new_data["TAXA"] = (
+        new_data["TAXA"]
+        .str.replace("Ã‚Â", "", regex=False)
+        .str.replace("Â", "", regex=False)
+        .str.replace("Ã", "", regex=False)
+        .str.replace("\xa0", " ", regex=False)
+        .str.strip()
+    )
+    new_data["VERT_OFFSET"] = new_data["VERT_OFFSET"].fillna("NA")
+    new_data["VARIABLE"] = "Cover"
+    new_data["UNIT"] = "%"
+    new_data = new_data[
+        [
+            "SITE_CODE",
+            "STATION_CODE",
+            "VERT_OFFSET",
+            "VARIABLE",
+            "TIME",
+            "TAXA",
+            "VALUE",
+            "UNIT",
+        ]
+    ]
 
     # Save new data to a csv file
     new_file_name = "IT_AppenninoCentroMeridionale_data_cover__from_FEM_Revised.csv"
-    new_data = pd.DataFrame(new_rows)
-    new_data.to_csv(source_folder / new_file_name, index=False, sep=";")
+    new_data.to_csv(
+        source_folder / new_file_name, index=False, sep=";", chunksize=CSV_CHUNK_SIZE
+    )
 
 
 def convert_raw_data_ASQ_C():
@@ -109,87 +117,120 @@ def convert_raw_data_ASQ_C():
 
     # Read data from csv file
     raw_data = pd.read_csv(source_folder / file_name, sep=";")
-    new_rows = []
+    species_columns = raw_data.columns[3:]
+    times = []
 
     # Read additional data for replication dates from csv file
     file_name = "Species_number_Coverage_ReplicationPlotFieldYearMonth.csv"
     time_data = pd.read_csv(source_folder / file_name, sep=";")
 
-    # For each row in raw_data, extract the column entries with general information
-    for _, row in raw_data.iterrows():
-        year = row["Year"]
-        station_code = row["Plot"]
-        replication = row["Replication"]
-
-        # Extract time from time_data, find month for row that matches Plot, Year and Replication
-        # check if there is only one row that matches the criteria
-
-        months = time_data[
-            (time_data["Plot"] == station_code)
-            & (time_data["Year"] == year)
-            & (time_data["Replication"] == replication)
-        ]["Month"].values
+    # Collect months from time_data for each combination of Plot, Year and Replication
+    months_per_entry = time_data.groupby(["Plot", "Year", "Replication"])["Month"].agg(
+        list
+    )
+    raw_data = raw_data.join(
+        months_per_entry.rename("MONTHS"), on=["Plot", "Year", "Replication"]
+    )
+    entries_without_month = []
+    entries_with_multiple_months = []
 
-        if len(months) == 1:
+    for station_code, year, replication, months in zip(
+        raw_data["Plot"], raw_data["Year"], raw_data["Replication"], raw_data["MONTHS"]
+    ):
+        if not isinstance(months, list):
+            time = f"{year}"
+            entries_without_month.append((station_code, year, replication))
+        elif len(months) == 1:
             # set date to 15th of month in format DD.MM.YYYY
             time = f"15.{months[0]:02d}.{year}"
-        elif len(months) == 0:
-            logger.warning(
-                f"No month found in time data for Plot {station_code}, Year {year}, Replication {replication}."
-            )
-            time = f"{year}"
         else:
             # set date to mean each month found
             dates_ordinal = [datetime(year, month, 15).toordinal() for month in months]
             time = datetime.fromordinal(
                 int(sum(dates_ordinal) / len(dates_ordinal))
             ).strftime("%d.%m.%Y")
-
-            logger.warning(
-                f"Multiple months found ({months}) in time data for Plot {station_code}, Year {year}, Replication {replication}. "
-                f"Using mean date: {time}."
+            entries_with_multiple_months.append(
+                (station_code, year, replication, months, time)
             )
 
-        # Extract values for each species column (E to end)
-        for column in raw_data.columns[3:]:
-            column_name = column
-            column_value = row[column]
-            # check if column value is float
-            if pd.notna(column_value) and not isinstance(column_value, (float)):
-                # replace commas
-                if isinstance(column_value, str):
-                    if "," in column_value:
-                        logger.warning(
-                            f"Replacing comma(s) in value '{column_value}' in column {column}."
-                        )
-                        column_value = column_value.replace(",", "")
+        times.append(time)
 
-                    column_value = float(column_value)
-                else:
-                    logger.warning(
-                        f"Value '{column_value}' in column {column} is not a float, string or nan."
-                    )
-                    column_value = None
+    if entries_without_month:
+        logger.warning(
+            f"No month found in time data for {len(entries_without_month)} entries "
+            f"(Plot, Year, Replication): {entries_without_month}."
+        )
 
-            # Add new row if column value is finite and greater than 0
-            if column_value and column_value > 0:
-                new_rows.append(
-                    {
-                        "SITE_CODE": site_code,
-                        "STATION_CODE": station_code,
-                        "REPLICATION": replication,
-                        "VARIABLE": "Cover",
-                        "TIME": time,
-                        "TAXA": column_name,
-                        "VALUE": column_value,
-                        "UNIT": "%",
-                    }
-                )
+    if entries_with_multiple_months:
+        logger.warning(
+            f"Multiple months found in time data for {len(entries_with_multiple_months)} entries, "
+            f"using mean dates (Plot, Year, Replication, Months, Date): {entries_with_multiple_months}."
+        )
+
+    raw_data["TIME"] = times
+
+    # Convert from wide (one column per species, D to end) to long format,
+    # keep row-wise order of original entries
+    new_data = raw_data.melt(
+        id_vars=["Plot", "Replication", "TIME"],
+        value_vars=species_columns,
+        var_name="TAXA",
+        value_name="VALUE",
+        ignore_index=False,
+    ).sort_index(kind="stable")
+
+    # Convert values to float, strings can contain commas, other types are not valid
+    values = new_data["VALUE"]
+    is_string = values.map(lambda value: isinstance(value, str))
+    is_float = values.map(lambda value: isinstance(value, float))
+    has_comma = is_string & values.astype(str).str.contains(",", regex=False)
+    is_invalid = values.notna() & ~is_string & ~is_float
+
+    for column, column_value in new_data.loc[has_comma, ["TAXA", "VALUE"]].itertuples(
+        index=False
+    ):
+        logger.warning(
+            f"Replacing comma(s) in value '{column_value}' in column {column}."
+        )
+
+    for column, column_value in new_data.loc[is_invalid, ["TAXA", "VALUE"]].itertuples(
+        index=False
+    ):
+        logger.warning(
+            f"Value '{column_value}' in column {column} is not a float, string or nan."
+        )
+
+    values = values.where(
+        ~is_string, values.astype(str).str.replace(",", "", regex=False)
+    )
+    new_data["VALUE"] = pd.to_numeric(values.where(is_string | is_float))
+
+    # Only keep entries if value is finite and greater than 0
+    new_data = new_data[new_data["VALUE"] > 0]
+    new_data = new_data.rename(
+        columns={"Plot": "STATION_CODE", "Replication": "REPLICATION"}
+    )
+    new_data["SITE_CODE"] = site_code
+    new_data["VARIABLE"] = "Cover"
+    new_data["UNIT"] = "%"
+    new_data = new_data[
+        [
+            "SITE_CODE",
+            "STATION_CODE",
+            "REPLICATION",
+            "VARIABLE",
+            "TIME",
+            "TAXA",
+            "VALUE",
+            "UNIT",
+        ]
+    ]
 
     # Save new data to a csv file
     new_file_name = "DE_AgroScapeQuillow_data_cover__from_SpeciesFiles.csv"
-    new_data = pd.DataFrame(new_rows)
-    new_data.to_csv(source_folder / new_file_name, index=False, sep=";")
+    new_data.to_csv(
+        source_folder / new_file_name, index=False, sep=";", chunksize=CSV_CHUNK_SIZE
+    )
 
 
 def convert_raw_data_KUL(forbidden_cover_threshold=0):
@@ -360,7 +401,7 @@ def extract_plot_locations(shapefile_path, output_csv_path, site_code="KUL-site"
         shape_df.to_csv(output_csv_path, index=False, sep=";")
 
     except Exception as e:
-        print(f"Error processing shapefile: {e}")
+        logger.error(f"Error processing shapefile: {e}")
         return None
 
 
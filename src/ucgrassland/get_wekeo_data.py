@@ -38,6 +38,7 @@ Data sources:
     - License: Apache License 2.0, https://github.com/ecmwf/hda/blob/master/LICENSE.txt
 """
 
+import threading
 import time
 import zipfile
 from pathlib import Path
@@ -90,6 +91,9 @@ HDA_SPECS = MappingProxyType(
     }
 )
 
+# Lock shared by all threads requesting HDA data
+HDA_REQUEST_LOCK = threading.Lock()
+
 
 def create_hda_client(hda_configuration_folder=None, retry_max=6, sleep_max=8):
     """
@@ -203,228 +207,231 @@ def request_hda_grassland_data(
     Returns:
         hda_file_stems (list): List of file stems of the downloaded HDA data.
     """
-    if target_folder is None:
-        target_folder = Path.cwd() / opendap_folder
-    elif isinstance(target_folder, str):
-        target_folder = Path.cwd() / target_folder
-
-    if map_key == "EUR_hda_grassland":
-        years_available = [2015, 2017, 2018, 2019, 2020, 2021]
-    else:
-        years_available = [2017, 2018, 2019, 2020, 2021]
-
-    if year in years_available:
-        if year == 2015 and resolution == "10m":
-            # Note: also 20m resolution seems not downloadable for 2015
-            logger.warning(
-                "HDA grassland data for 2015 is only available at 20m or 100m resolution. "
-                "Using 20m resolution instead of 10m."
-            )
-            resolution = "20m"
-
-        if map_key in HDA_SPECS.keys():
-            # Create target folder if it does not exist
-            if not target_folder.is_dir():
-                logger.info(f"Creating target folder: {target_folder} ...")
-                target_folder.mkdir(parents=True, exist_ok=True)
-
-            # Get area (bounding box) of all coordinates
-            area_coordinates = get_area_coordinates(coordinates_list)
-            logger.info(
-                f"Looking for HDA data for map_key '{map_key}', year '{year}', "
-                f"latitude {area_coordinates['lat_start']}-{area_coordinates['lat_end']}, "
-                f"longitude {area_coordinates['lon_start']}-{area_coordinates['lon_end']} "
-                "from 'HRL Grasslands' dataset ..."
-            )
+    # Serialize requests, the HDA client may prompt for credentials and all requests
+    # download, extract and remove zip files in the same target folder
+    with HDA_REQUEST_LOCK:
+        if target_folder is None:
+            target_folder = Path.cwd() / opendap_folder
+        elif isinstance(target_folder, str):
+            target_folder = Path.cwd() / target_folder
+
+        if map_key == "EUR_hda_grassland":
+            years_available = [2015, 2017, 2018, 2019, 2020, 2021]
+        else:
+            years_available = [2017, 2018, 2019, 2020, 2021]
+
+        if year in years_available:
+            if year == 2015 and resolution == "10m":
+                # Note: also 20m resolution seems not downloadable for 2015
+                logger.warning(
+                    "HDA grassland data for 2015 is only available at 20m or 100m resolution. "
+                    "Using 20m resolution instead of 10m."
+                )
+                resolution = "20m"
+
+            if map_key in HDA_SPECS.keys():
+                # Create target folder if it does not exist
+                if not target_folder.is_dir():
+                    logger.info(f"Creating target folder: {target_folder} ...")
+                    target_folder.mkdir(parents=True, exist_ok=True)
+
+                # Get area (bounding box) of all coordinates
+                area_coordinates = get_area_coordinates(coordinates_list)
+                logger.info(
+                    f"Looking for HDA data for map_key '{map_key}', year '{year}', "
+                    f"latitude {area_coordinates['lat_start']}-{area_coordinates['lat_end']}, "
+                    f"longitude {area_coordinates['lon_start']}-{area_coordinates['lon_end']} "
+                    "from 'HRL Grasslands' dataset ..."
+                )
 
-            # Check if all files are already available
-            if not force_download:
-                hda_file_stems = []
-                files_missing = False
+                # Check if all files are already available
+                if not force_download:
+                    hda_file_stems = []
+                    files_missing = False
 
-                for coordinates in coordinates_list:
-                    (easting, northing) = reproject_coordinates(
-                        coordinates["lat"], coordinates["lon"], "EPSG:3035"
-                    )
-                    east_index = int(easting // 100000)
-                    north_index = int(northing // 100000)
-
-                    for layer, file_start in enumerate(
-                        HDA_SPECS[map_key]["file_starts"]
-                    ):
-                        hda_file_start = f"{file_start}{year}_R{resolution}_E{east_index}N{north_index}_03035"
-                        hda_files_found = list(
-                            target_folder.glob(f"{hda_file_start}*.tif")
+                    for coordinates in coordinates_list:
+                        (easting, northing) = reproject_coordinates(
+                            coordinates["lat"], coordinates["lon"], "EPSG:3035"
                         )
-
-                        # try to find the file on opendap if not found locally
-                        if len(hda_files_found) == 0:
-                            for version in ["V01", "V02"]:
-                                hda_file_tif = Path(
-                                    target_folder
-                                    / f"{hda_file_start}_{version}_R00.tif"
-                                )
-                                download_file_opendap(
-                                    hda_file_tif.name,
-                                    opendap_folder,
-                                    hda_file_tif.parent,
-                                )
-
-                                # stop searching if file is found
-                                if hda_file_tif.is_file():
-                                    hda_files_found.append(hda_file_tif)
-                                    break
-
-                        if len(hda_files_found) == 1:
-                            hda_file_stems.append(hda_files_found[0].stem)
-                        elif len(hda_files_found) > 1:
-                            logger.warning(
-                                f"Multiple HDA files found for map_key '{map_key}', year '{year}', layer '{layer + 1}', "
-                                f"{coordinates}: {hda_files_found}. Using first file."
+                        east_index = int(easting // 100000)
+                        north_index = int(northing // 100000)
+
+                        for layer, file_start in enumerate(
+                            HDA_SPECS[map_key]["file_starts"]
+                        ):
+                            hda_file_start = f"{file_start}{year}_R{resolution}_E{east_index}N{north_index}_03035"
+                            hda_files_found = list(
+                                target_folder.glob(f"{hda_file_start}*.tif")
                             )
-                            hda_file_stems.append(hda_files_found[0].stem)
-                        else:
-                            files_missing = True
-                            break
 
-            if force_download or files_missing:
-                # Request HDA data
-                request = {
-                    "dataset_id": dataset_id,
-                    "bbox": [
-                        area_coordinates["lon_start"],
-                        area_coordinates["lat_end"],
-                        area_coordinates["lon_end"],
-                        area_coordinates["lat_start"],
-                    ],
-                    "productType": HDA_SPECS[map_key]["product_type"],
-                    "resolution": resolution,
-                    "year": str(year),
-                    "itemsPerPage": 100,
-                    "startIndex": 0,
-                }
-
-                # Get request results and download if needed including retry loop
-                while retry_attempts > 0:
-                    retry_attempts -= 1
-                    try:
-                        hda_client = create_hda_client()
-                        matches = hda_client.search(request)
-                        hda_file_stems = []
-                        file_count = min(len(matches), max_files)
-
-                        for match in matches[:file_count]:
-                            hda_file_stem = match.results[0]["id"]
-                            hda_file_stems.append(hda_file_stem)
-                            hda_file_tif = Path(target_folder / f"{hda_file_stem}.tif")
-
-                            # If file not locally available, try download from opendap server
-                            if not hda_file_tif.is_file() and not force_download:
-                                download_file_opendap(
-                                    hda_file_tif.name,
-                                    opendap_folder,
-                                    hda_file_tif.parent,
-                                )
+                            # try to find the file on opendap if not found locally
+                            if len(hda_files_found) == 0:
+                                for version in ["V01", "V02"]:
+                                    hda_file_tif = Path(
+                                        target_folder
+                                        / f"{hda_file_start}_{version}_R00.tif"
+                                    )
+                                    download_file_opendap(
+                                        hda_file_tif.name,
+                                        opendap_folder,
+                                        hda_file_tif.parent,
+                                    )
 
-                            # If file still not available, download from HDA API
-                            if not hda_file_tif.is_file() or force_download:
-                                logger.info(
-                                    f"Downloading '{hda_file_stem + '.zip'}' from WEkEO HDA API Client to '{target_folder}' ..."
-                                )
-                                match.download(download_dir=target_folder)
-                                hda_file_zip = Path(
-                                    target_folder / f"{hda_file_stem}.zip"
+                                    # stop searching if file is found
+                                    if hda_file_tif.is_file():
+                                        hda_files_found.append(hda_file_tif)
+                                        break
+
+                            if len(hda_files_found) == 1:
+                                hda_file_stems.append(hda_files_found[0].stem)
+                            elif len(hda_files_found) > 1:
+                                logger.warning(
+                                    f"Multiple HDA files found for map_key '{map_key}', year '{year}', layer '{layer + 1}', "
+                                    f"{coordinates}: {hda_files_found}. Using first file."
                                 )
+                                hda_file_stems.append(hda_files_found[0].stem)
+                            else:
+                                files_missing = True
+                                break
+
+                if force_download or files_missing:
+                    # Request HDA data
+                    request = {
+                        "dataset_id": dataset_id,
+                        "bbox": [
+                            area_coordinates["lon_start"],
+                            area_coordinates["lat_end"],
+                            area_coordinates["lon_end"],
+                            area_coordinates["lat_start"],
+                        ],
+                        "productType": HDA_SPECS[map_key]["product_type"],
+                        "resolution": resolution,
+                        "year": str(year),
+                        "itemsPerPage": 100,
+                        "startIndex": 0,
+                    }
+
+                    # Get request results and download if needed including retry loop
+                    while retry_attempts > 0:
+                        retry_attempts -= 1
+                        try:
+                            hda_client = create_hda_client()
+                            matches = hda_client.search(request)
+                            hda_file_stems = []
+                            file_count = min(len(matches), max_files)
+
+                            for match in matches[:file_count]:
+                                hda_file_stem = match.results[0]["id"]
+                                hda_file_stems.append(hda_file_stem)
+                                hda_file_tif = Path(target_folder / f"{hda_file_stem}.tif")
+
+                                # If file not locally available, try download from opendap server
+                                if not hda_file_tif.is_file() and not force_download:
+                                    download_file_opendap(
+                                        hda_file_tif.name,
+                                        opendap_folder,
+                                        hda_file_tif.parent,
+                                    )
 
-                                if hda_file_zip.is_file():
+                                # If file still not available, download from HDA API
+                                if not hda_file_tif.is_file() or force_download:
                                     logger.info(
-                                        f"Extracting files from '{hda_file_zip}' ..."
+                                        f"Downloading '{hda_file_stem + '.zip'}' from WEkEO HDA API Client to '{target_folder}' ..."
+                                    )
+                                    match.download(download_dir=target_folder)
+                                    hda_file_zip = Path(
+                                        target_folder / f"{hda_file_stem}.zip"
                                     )
 
-                                    with zipfile.ZipFile(hda_file_zip, "r") as zip_ref:
-                                        file_type = ".tif"
-                                        files_found = [
-                                            name
-                                            for name in zip_ref.namelist()
-                                            if name.endswith(file_type)
-                                        ]
-
-                                        if len(files_found) == 1:
-                                            extracted_path = zip_ref.extract(
-                                                files_found[0], target_folder
-                                            )
-                                            logger.info(
-                                                f"Extracted '{extracted_path}'."
-                                            )
-                                            set_no_data_value(
-                                                extracted_path,
-                                                HDA_SPECS[map_key]["no_data_value"],
-                                            )
-
-                                            if upload_opendap:
-                                                # Try upload new file to opendap server (requires permission)
-                                                upload_file_opendap(
-                                                    Path(extracted_path), opendap_folder
+                                    if hda_file_zip.is_file():
+                                        logger.info(
+                                            f"Extracting files from '{hda_file_zip}' ..."
+                                        )
+
+                                        with zipfile.ZipFile(hda_file_zip, "r") as zip_ref:
+                                            file_type = ".tif"
+                                            files_found = [
+                                                name
+                                                for name in zip_ref.namelist()
+                                                if name.endswith(file_type)
+                                            ]
+
+                                            if len(files_found) == 1:
+                                                extracted_path = zip_ref.extract(
+                                                    files_found[0], target_folder
+                                                )
+                                                logger.info(
+                                                    f"Extracted '{extracted_path}'."
+                                                )
+                                                set_no_data_value(
+                                                    extracted_path,
+                                                    HDA_SPECS[map_key]["no_data_value"],
                                                 )
-                                        elif len(files_found) == 0:
-                                            logger.warning(
-                                                f"No {file_type} file found in the zip file '{hda_file_zip.name}'. Skipping extraction."
-                                            )
-                                        else:
-                                            logger.warning(
-                                                f"Multiple {file_type} files found in the zip file '{hda_file_zip.name}'. Skipping extraction."
-                                            )
-
-                                    # Remove zip file after extraction
-                                    hda_file_zip.unlink(missing_ok=True)
-                                    logger.info(f"Removed zip file '{hda_file_zip}'.")
-                                else:
-                                    # Error if the zip file is not found
-                                    raise FileNotFoundError(
-                                        f"Zip file '{hda_file_zip}' not found after download."
-                                    )
-                        break
-                    except Exception as e:
-                        logger.error(
-                            f"Error while requesting/downloading HDA data: {e}"
-                        )
 
-                        if retry_attempts > 0:
-                            logger.info(
-                                f"Recreating HDA client and retrying in {retry_delay} seconds ..."
-                            )
-                            time.sleep(retry_delay)
-                            retry_delay *= 2
-                        else:
+                                                if upload_opendap:
+                                                    # Try upload new file to opendap server (requires permission)
+                                                    upload_file_opendap(
+                                                        Path(extracted_path), opendap_folder
+                                                    )
+                                            elif len(files_found) == 0:
+                                                logger.warning(
+                                                    f"No {file_type} file found in the zip file '{hda_file_zip.name}'. Skipping extraction."
+                                                )
+                                            else:
+                                                logger.warning(
+                                                    f"Multiple {file_type} files found in the zip file '{hda_file_zip.name}'. Skipping extraction."
+                                                )
+
+                                        # Remove zip file after extraction
+                                        hda_file_zip.unlink(missing_ok=True)
+                                        logger.info(f"Removed zip file '{hda_file_zip}'.")
+                                    else:
+                                        # Error if the zip file is not found
+                                        raise FileNotFoundError(
+                                            f"Zip file '{hda_file_zip}' not found after download."
+                                        )
+                            break
+                        except Exception as e:
                             logger.error(
-                                "Maximum number of attempts reached. Exiting without downloading data."
+                                f"Error while requesting/downloading HDA data: {e}"
                             )
-                            matches = []
 
-                if file_count == 0:
-                    logger.warning(
-                        f"No data found for map_key '{map_key}' and year '{year}' in the specified area."
-                    )
-                elif file_count < len(matches):
-                    logger.warning(
-                        f"More than {max_files} files found ({len(matches)} files) for map_key '{map_key}' and year '{year}' in the specified area. "
-                        f"Using only the first {max_files} files."
+                            if retry_attempts > 0:
+                                logger.info(
+                                    f"Recreating HDA client and retrying in {retry_delay} seconds ..."
+                                )
+                                time.sleep(retry_delay)
+                                retry_delay *= 2
+                            else:
+                                logger.error(
+                                    "Maximum number of attempts reached. Exiting without downloading data."
+                                )
+                                matches = []
+
+                    if file_count == 0:
+                        logger.warning(
+                            f"No data found for map_key '{map_key}' and year '{year}' in the specified area."
+                        )
+                    elif file_count < len(matches):
+                        logger.warning(
+                            f"More than {max_files} files found ({len(matches)} files) for map_key '{map_key}' and year '{year}' in the specified area. "
+                            f"Using only the first {max_files} files."
+                        )
+            else:
+                try:
+                    raise ValueError(
+                        f"Invalid map_key '{map_key}'. Valid keys are: {list(HDA_SPECS.keys())}"
                     )
+                except ValueError as e:
+                    logger.error(e)
+                    return []
         else:
-            try:
-                raise ValueError(
-                    f"Invalid map_key '{map_key}'. Valid keys are: {list(HDA_SPECS.keys())}"
-                )
-            except ValueError as e:
-                logger.error(e)
-                return []
-    else:
-        logger.warning(
-            f"'{map_key}' map not available for {year}. Valid years are: {', '.join(str(y) for y in years_available)}."
-        )
-        return []
+            logger.warning(
+                f"'{map_key}' map not available for {year}. Valid years are: {', '.join(str(y) for y in years_available)}."
+            )
+            return []
 
-    return hda_file_stems
+        return hda_file_stems
 
 
 def main():
@@ -24,7 +24,7 @@ Science Ltd., Finland and the LUMI consortium through a EuroHPC Development Acce
 """
 
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, TimedRotatingFileHandler
 from pathlib import Path
 
 for handler in logging.root.handlers[:]:
@@ -58,3 +58,20 @@ logger.addHandler(stream_handler)
 
 # Capture warnings and log them
 logging.captureWarnings(True)
+
+
+def log_to_queue(log_queue):
+    """
+    Send log records of the current process to a queue instead of the log file and console.
+
+    Used in worker processes, so that only a listener in the main process writes to (and rotates)
+    the log file.
+
+    Parameters:
+        log_queue (multiprocessing.Queue): Queue read by a QueueListener in the main process.
+    """
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+
+    logger.addHandler(QueueHandler(log_queue))
@@ -26,30 +26,56 @@ Science Ltd., Finland and the LUMI consortium through a EuroHPC Development Acce
 """
 
 import argparse
+import errno
+import multiprocessing
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from logging.handlers import QueueListener
 from pathlib import Path
 
+import pandas as pd
 from dotenv import dotenv_values
 
-from ucgrassland import (
-    check_if_grassland,
-    prep_management_data,
-    prep_soil_data,
-    prep_weather_data,
-)
 from ucgrassland import elter_site_specs as essp
+from ucgrassland import logger_config
 from ucgrassland import utils as ut
 from ucgrassland.elter_site_specs import OBSERVATION_DATA_SPECS_PER_SITE
 from ucgrassland.logger_config import logger
 
+# Land cover maps for grassland checks of all locations
+DEFAULT_LAND_COVER_MAP_KEYS = (
+    "EUR_hrl_grassland",
+    # "EUR_hda_grassland_2015",
+    "EUR_hda_grassland_2017",
+    "EUR_hda_grassland_2018",
+    "EUR_hda_grassland_2019",
+    "EUR_hda_grassland_2020",
+    "EUR_hda_grassland_2021",
+    "EUR_Pflugmacher",
+)
+# Additional land cover maps for grassland checks of locations in Germany
+GERMAN_LAND_COVER_MAP_KEYS = (
+    "GER_Preidl",
+    "GER_Schwieder_2017",
+    "GER_Schwieder_2018",
+    "GER_Schwieder_2019",
+    "GER_Schwieder_2020",
+    "GER_Schwieder_2021",
+    "GER_Lange_2017",
+    # "GER_Lange_2018", only 1 GER_Lange map needed as both use German ATKIS digital landscape model 2015
+)
+
 
-def add_coordinate_infos(coordinates):
+def add_coordinate_infos(coordinates, *, input_folder=None):
     """
     Add information to coordinates dictionary.
 
     Parameters:
         coordinates (dict): Coordinates dictionary with 'lat' and 'lon'.
+        input_folder (Path): Folder for all location head folders (default is None,
+            'grasslandModelInputFiles' in current working directory is used).
 
     Returns:
         dict: Coordinates dictionary with additional information (if 'lat' and 'lon' are present, otherwise None):
@@ -59,6 +85,9 @@ def add_coordinate_infos(coordinates):
             'location_head_folder' (Path): Location head folder.
     """
     if "lat" in coordinates and "lon" in coordinates:
+        if input_folder is None:
+            input_folder = Path.cwd() / "grasslandModelInputFiles"
+
         # Prepare location coordinates for file names and folder
         formatted_lat = f"lat{coordinates['lat']:.6f}"
         formatted_lon = f"lon{coordinates['lon']:.6f}"
@@ -68,9 +97,7 @@ def add_coordinate_infos(coordinates):
                 "formatted_lat": formatted_lat,
                 "formatted_lon": formatted_lon,
                 "file_start": file_start,
-                "location_head_folder": Path.cwd()
-                / "grasslandModelInputFiles"
-                / file_start,
+                "location_head_folder": input_folder / file_start,
             }
         )
 
@@ -92,6 +119,11 @@ def get_input_data(
     skip_weather=False,
     skip_soil=False,
     skip_management=False,
+    force=False,
+    require_grassland=False,
+    strict_grassland=False,
+    max_workers=4,
+    grass_check_cache_file=None,
 ):
     """
     Process data to be used as grassland site information and model input:
@@ -102,94 +134,200 @@ def get_input_data(
 
     Parameters:
         coordinates_list (list of dict): List of dictionaries with 'lat' and 'lon' keys.
-        years (list of int): Years list.
+        years (list or range of int): Years list.
         skip_grass_check (bool): Skip grassland checks (default is False).
         skip_weather (bool): Skip weather data preparation (default is False).
         skip_soil (bool): Skip soil data preparation (default is False).
         skip_management (bool): Skip management data preparation (default is False).
+        force (bool): Prepare data again even if output files already exist (default is False).
+        require_grassland (bool): Prepare weather, soil and management data only for locations classified
+            as grassland by at least one land cover map (default is False, not used if grassland checks are skipped).
+        strict_grassland (bool): Skip all years of 'GER_Lange' and 'GER_Schwieder' management maps if location is
+            no grassland in first year with map (default is False).
+        max_workers (int): Maximum number of parallel requests, i.e. locations or maps processed in parallel
+            (default is 4).
+        grass_check_cache_file (Path): SQLite file to reuse and store grassland check results
+            (default is None, '_cache/grass_checks.sqlite' in input files folder used if not provided).
     """
+    # Import data preparation modules only when needed, they load the weather and soil data packages
+    from ucgrassland import (
+        check_if_grassland,
+        prep_management_data,
+        prep_soil_data,
+        prep_weather_data,
+    )
+
     # Init dialogue
     location_count = len(coordinates_list)
     logger.info(
         f"Preparing input data for coordinates list with {location_count} locations ..."
     )
 
+    # Add coordinate infos once for all stages, skip locations without valid coordinates
+    # and duplicates (same location folder), as they would prepare the same files again
+    unique_coordinates = {}
+    input_folder = Path.cwd() / "grasslandModelInputFiles"
+
     for coordinates in coordinates_list:
-        coordinates = add_coordinate_infos(coordinates)
+        coordinates = add_coordinate_infos(coordinates, input_folder=input_folder)
+
+        if coordinates is not None:
+            unique_coordinates.setdefault(coordinates["file_start"], coordinates)
+
+    if len(unique_coordinates) < location_count:
+        logger.info(
+            f"Preparing input data for {len(unique_coordinates)} unique valid locations."
+        )
+
+    coordinates_list = list(unique_coordinates.values())
+
+    # Get countries one by one, as country requests are rate limited
+    if not skip_grass_check or not skip_management:
+        countries = [ut.get_country(coordinates) for coordinates in coordinates_list]
+
+    def _run_per_location(prepare_location, *location_args):
+        # Locations are independent, overlap their requests and downloads
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(prepare_location, coordinates_list, *location_args))
+
+    def _is_prepared(file_name):
+        # Empty files can be left over from interrupted runs
+        return not force and file_name.is_file() and file_name.stat().st_size > 0
+
+    def _get_grassland_check_file(coordinates):
+        return (
+            coordinates["location_head_folder"]
+            / "landCover"
+            / f"{coordinates['file_start']}__grasslandCheck__allMaps.txt"
+        )
 
     # Check if grassland according to all available land cover maps
-    if skip_grass_check:
-        logger.info("Grassland checks skipped.")
-    else:
-        default_land_cover_map_keys = [
-            "EUR_hrl_grassland",
-            # "EUR_hda_grassland_2015",
-            "EUR_hda_grassland_2017",
-            "EUR_hda_grassland_2018",
-            "EUR_hda_grassland_2019",
-            "EUR_hda_grassland_2020",
-            "EUR_hda_grassland_2021",
-            "EUR_Pflugmacher",
-        ]
-        german_land_cover_map_keys = [
-            "GER_Preidl",
-            "GER_Schwieder_2017",
-            "GER_Schwieder_2018",
-            "GER_Schwieder_2019",
-            "GER_Schwieder_2020",
-            "GER_Schwieder_2021",
-            "GER_Lange_2017",
-            # "GER_Lange_2018", only 1 GER_Lange map needed as both use German ATKIS digital landscape model 2015
-        ]
+    def _check_grassland():
+        # Collect map keys per location, each map is then checked for all its locations at once
+        grass_locations = []
+        land_cover_map_keys_per_location = []
 
-        for coordinates in coordinates_list:
-            if coordinates is not None:
-                logger.info(
-                    f"Preparing grassland check data for latitude: {coordinates['lat']}, "
-                    f"longitude: {coordinates['lon']} ...",
-                )
-                grassland_checks = []
-                land_cover_map_keys = default_land_cover_map_keys.copy()
+        for coordinates, country in zip(coordinates_list, countries):
+            file_name = _get_grassland_check_file(coordinates)
 
-                if ut.get_country(coordinates) == "DE":
-                    land_cover_map_keys.extend(german_land_cover_map_keys)
+            if _is_prepared(file_name):
+                logger.info(f"Grassland checks file '{file_name}' exists. Skipped.")
+                continue
 
-                # # "EUR_eunis_habitat" works for DEIMS.iDs, but not useful as representative location is not the plot location!
-                # if coordinates.get("deims_id"):
-                #     land_cover_map_keys.append("EUR_eunis_habitat")
+            land_cover_map_keys = DEFAULT_LAND_COVER_MAP_KEYS
 
-                for map_key in land_cover_map_keys:
-                    check_this_map = check_if_grassland.check_locations_for_grassland(
-                        [coordinates], map_key
-                    )
-                    grassland_checks.append(check_this_map[0])
+            if country == "DE":
+                land_cover_map_keys += GERMAN_LAND_COVER_MAP_KEYS
 
-                file_name = (
-                    coordinates["location_head_folder"]
-                    / "landCover"
-                    / f"{coordinates['file_start']}__grasslandCheck__allMaps.txt"
-                )
-                grassland_checks.sort(key=lambda x: x["map_year"])
-                check_if_grassland.check_results_to_file(
-                    grassland_checks, file_name=file_name
+            # # "EUR_eunis_habitat" works for DEIMS.iDs, but not useful as representative location is not the plot location!
+            # if coordinates.get("deims_id"):
+            #     land_cover_map_keys += ("EUR_eunis_habitat",)
+
+            grass_locations.append(coordinates)
+            land_cover_map_keys_per_location.append(land_cover_map_keys)
+
+        all_land_cover_map_keys = list(
+            dict.fromkeys(
+                map_key
+                for land_cover_map_keys in land_cover_map_keys_per_location
+                for map_key in land_cover_map_keys
+            )
+        )
+        grassland_checks_per_location = [[] for _ in grass_locations]
+        # Land cover maps are static, reuse check results from previous runs
+        cache_file = grass_check_cache_file or (
+            input_folder / "_cache" / "grass_checks.sqlite"
+        )
+
+        def _check_map_for_locations(map_key):
+            location_indices = [
+                index
+                for index, land_cover_map_keys in enumerate(
+                    land_cover_map_keys_per_location
                 )
+                if map_key in land_cover_map_keys
+            ]
+            check_this_map = check_if_grassland.check_locations_for_grassland(
+                [grass_locations[index] for index in location_indices],
+                map_key,
+                cache_file=cache_file,
+                max_workers=1,  # maps are already checked in parallel
+            )
+
+            return location_indices, check_this_map
+
+        # Maps are independent, overlap their requests and downloads
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            checks_per_map = list(
+                executor.map(_check_map_for_locations, all_land_cover_map_keys)
+            )
+
+        # All checks of one map have the same map year, so sort maps once instead of
+        # sorting the checks of each location
+        checks_per_map.sort(
+            key=lambda map_checks: map_checks[1][0]["map_year"] if map_checks[1] else 0
+        )
+
+        for location_indices, check_this_map in checks_per_map:
+            for index, check_result in zip(location_indices, check_this_map):
+                grassland_checks_per_location[index].append(check_result)
+
+        for coordinates, grassland_checks in zip(
+            grass_locations, grassland_checks_per_location
+        ):
+            check_if_grassland.check_results_to_file(
+                grassland_checks, file_name=_get_grassland_check_file(coordinates)
+            )
 
     # Run weather script
-    if skip_weather:
-        logger.info("Weather data preparation skipped.")
-    else:
+    def _prepare_weather():
         # Use preliminary target folder for all weather data, later move to each single location folder
-        target_folder = Path.cwd() / "grasslandModelInputFiles" / "weatherDataPrepared"
+        # Separate folder per process, parallel site processes must not move each other's files
+        target_folder = input_folder / "weatherDataPrepared" / f"process_{os.getpid()}"
+
+        if force:
+            weather_locations = coordinates_list
+        else:
+            # Weather files need to cover the requested time period
+            weather_locations = [
+                coordinates
+                for coordinates in coordinates_list
+                if not any(
+                    map(
+                        _is_prepared,
+                        (coordinates["location_head_folder"] / "weather").glob(
+                            f"{coordinates['file_start']}*{years[0]}*{years[-1]}*weather.txt"
+                        ),
+                    )
+                )
+            ]
+
+            if len(weather_locations) < len(coordinates_list):
+                logger.info(
+                    f"Weather files exist for {len(coordinates_list) - len(weather_locations)} locations. Skipped."
+                )
+
+            if not weather_locations:
+                return
+
         prep_weather_data.prep_weather_data(
-            coordinates_list,
-            years,
+            weather_locations,
+            list(years),  # weather data package expects a list
             target_folder=target_folder,
         )
 
-        for coordinates in coordinates_list:
-            # Check target folder for weather files containing the coordinates
-            weather_files = list(
-                target_folder.glob(f"{coordinates['file_start']}*weather.txt")
+        # Scan target folder once, group weather files by the coordinates in their names
+        weather_files_per_location = {}
+
+        for weather_file in target_folder.glob("*weather.txt"):
+            weather_files_per_location.setdefault(
+                weather_file.name.split("__", 1)[0], []
+            ).append(weather_file)
+
+        for coordinates in weather_locations:
+            # Get weather files containing the coordinates, each file is only moved once
+            weather_files = weather_files_per_location.pop(
+                coordinates["file_start"], []
             )
 
             if len(weather_files) > 1:
@@ -200,33 +338,84 @@ def get_input_data(
                 )
 
             # Move weather files to location folder
-            for weather_file in weather_files:
+            if weather_files:
                 final_folder = coordinates["location_head_folder"] / "weather"
                 final_folder.mkdir(parents=True, exist_ok=True)
+
+            for weather_file in weather_files:
                 final_file = final_folder / weather_file.name
-                shutil.move(weather_file, final_file)
+
+                try:
+                    weather_file.replace(final_file)
+                except OSError as e:
+                    # Rename only works within one file system, copy otherwise
+                    if e.errno != errno.EXDEV:
+                        raise
+
+                    shutil.move(weather_file, final_file)
+
+        # Remove process folder if all files were moved
+        if target_folder.is_dir() and not any(target_folder.iterdir()):
+            target_folder.rmdir()
 
     # Run soil script
-    if skip_soil:
-        logger.info("Soil data preparation skipped.")
-    else:
-        for coordinates in coordinates_list:
+    def _prepare_soil():
+        def _prepare_soil_data(coordinates):
             file_name = (
                 coordinates["location_head_folder"]
                 / "soil"
                 / f"{coordinates['file_start']}__2020__soil.txt"
             )
+
+            if _is_prepared(file_name):
+                logger.info(f"Soil file '{file_name}' exists. Skipped.")
+                return
+
             prep_soil_data.prep_soil_data(coordinates, file_name=file_name)
 
-    # Run management script
-    if skip_management:
-        logger.info("Management data preparation skipped.")
-    else:
+        # Prepare locations one by one, the soil package is not thread-safe
         for coordinates in coordinates_list:
+            _prepare_soil_data(coordinates)
+
+    # Run management script
+    def _prepare_management():
+        time_span = f"{years[0]}-01-01_{years[-1]}-12-31"
+
+        def _get_management_file(coordinates, map_key):
+            return (
+                coordinates["location_head_folder"]
+                / "management"
+                / f"{coordinates['file_start']}__{time_span}__management__{map_key}.txt"
+            )
+
+        # Read 'GER_Lange' maps only once for all German locations
+        lange_locations = [
+            coordinates
+            for coordinates, country in zip(coordinates_list, countries)
+            if country == "DE"
+            and not _is_prepared(_get_management_file(coordinates, "GER_Lange"))
+        ]
+        lange_data_per_location = (
+            dict(
+                zip(
+                    (coordinates["file_start"] for coordinates in lange_locations),
+                    prep_management_data.get_GER_Lange_data_for_locations(
+                        lange_locations,
+                        years,
+                        strict_grassland=strict_grassland,
+                        max_workers=max_workers,
+                    ),
+                )
+            )
+            if lange_locations
+            else {}
+        )
+
+        def _prepare_management_data(coordinates, country):
             land_use_map_keys = ["EUR_hda_mowing"]
 
             # add German land use maps for locations in Germany
-            if ut.get_country(coordinates) == "DE":
+            if country == "DE":
                 land_use_map_keys.extend(["GER_Lange", "GER_Schwieder"])
 
             # add specific management regimes to look up from observations/assumptions
@@ -242,19 +431,155 @@ def get_input_data(
                     land_use_map_keys.extend(["AT_STB"])
 
             for map_key in land_use_map_keys:
-                file_name = (
-                    coordinates["location_head_folder"]
-                    / "management"
-                    / f"{coordinates['file_start']}__{years[0]}-01-01_{years[-1]}-12-31__management__{map_key}.txt"
-                )
+                file_name = _get_management_file(coordinates, map_key)
+
+                if _is_prepared(file_name):
+                    logger.info(f"Management file '{file_name}' exists. Skipped.")
+                    continue
+
                 prep_management_data.prep_management_data(
-                    coordinates, years, map_key, file_name=file_name
+                    coordinates,
+                    years,
+                    map_key,
+                    file_name=file_name,
+                    strict_grassland=strict_grassland,
+                    max_workers=1,  # locations are already prepared in parallel
+                    map_data=lange_data_per_location.get(coordinates["file_start"])
+                    if map_key == "GER_Lange"
+                    else None,
                 )
 
+        _run_per_location(_prepare_management_data, countries)
+
+    stages = []
+
+    if skip_grass_check:
+        logger.info("Grassland checks skipped.")
+    else:
+        stages.append(_check_grassland)
+
+    if skip_weather:
+        logger.info("Weather data preparation skipped.")
+    else:
+        stages.append(_prepare_weather)
+
+    if skip_soil:
+        logger.info("Soil data preparation skipped.")
+    else:
+        stages.append(_prepare_soil)
+
+    if skip_management:
+        logger.info("Management data preparation skipped.")
+    else:
+        stages.append(_prepare_management)
+
+    if require_grassland and not skip_grass_check:
+        # Check land cover first, then only prepare further data for grassland locations
+        stages.remove(_check_grassland)
+        _check_grassland()
+        is_grassland = [
+            pd.read_csv(_get_grassland_check_file(coordinates), sep="\t")["is_grass"]
+            .astype(str)
+            .eq("True")
+            .any()
+            for coordinates in coordinates_list
+        ]
+        coordinates_list = [
+            coordinates
+            for coordinates, is_grass in zip(coordinates_list, is_grassland)
+            if is_grass
+        ]
+        countries = [
+            country for country, is_grass in zip(countries, is_grassland) if is_grass
+        ]
+        logger.info(
+            f"{len(coordinates_list)} of {len(is_grassland)} locations classified as grassland."
+        )
+
+    # Run stages one after another, the weather and soil packages are not thread-safe
+    for stage in stages:
+        stage()
+
     # Finish dialogues
     logger.info(f"Input data preparation finished (for {location_count} locations).")
 
 
+def get_site_input_data(
+    deims_id,
+    source_folder,
+    last_year,
+    skip_grass_check=False,
+    skip_weather=False,
+    skip_soil=False,
+    skip_management=False,
+    force=False,
+    require_grassland=False,
+    strict_grassland=False,
+    max_workers=4,
+):
+    """
+    Process data to be used as grassland model input for all plot locations of an eLTER site.
+
+    Parameters:
+        deims_id (str): DEIMS.iD of the site.
+        source_folder (Path): Folder with processed eLTER data, containing site folders with station files.
+        last_year (int): Last year of desired time period.
+        skip_grass_check (bool): Skip grassland checks (default is False).
+        skip_weather (bool): Skip weather data preparation (default is False).
+        skip_soil (bool): Skip soil data preparation (default is False).
+        skip_management (bool): Skip management data preparation (default is False).
+        force (bool): Prepare data again even if output files already exist (default is False).
+        require_grassland (bool): Prepare weather, soil and management data only for locations classified
+            as grassland by at least one land cover map (default is False).
+        strict_grassland (bool): Skip all years of 'GER_Lange' and 'GER_Schwieder' management maps if location is
+            no grassland in first year with map (default is False).
+        max_workers (int): Maximum number of parallel requests for the site (default is 4).
+    """
+    site_specs = OBSERVATION_DATA_SPECS_PER_SITE[deims_id]
+    station_file = source_folder / deims_id / site_specs["station_file"]
+    coordinates_list = ut.get_plot_locations_from_csv(
+        station_file,
+        deims_id=deims_id if deims_id not in ["KUL-site"] else None,
+    )
+
+    # Specify site-specific time range, 1951 min year because dataset starts 1950 and last month of previous year needed
+    first_year = max(1951, site_specs["start_year"] - 10)
+    years = range(first_year, last_year + 1)
+
+    get_input_data(
+        coordinates_list,
+        years,
+        skip_grass_check=skip_grass_check,
+        skip_weather=skip_weather,
+        skip_soil=skip_soil,
+        skip_management=skip_management,
+        force=force,
+        require_grassland=require_grassland,
+        strict_grassland=strict_grassland,
+        max_workers=max_workers,
+        # Own cache file per site, sites are prepared in parallel processes
+        grass_check_cache_file=Path.cwd()
+        / "grasslandModelInputFiles"
+        / "_cache"
+        / f"grass_checks__{deims_id}.sqlite",
+    )
+
+
+def init_site_process(log_queue, hda_request_lock):
+    """
+    Initialize a process for preparing eLTER sites, share logging and HDA requests with the main process.
+
+    Parameters:
+        log_queue (multiprocessing.Queue): Queue for log records, written to log file by the main process.
+        hda_request_lock (multiprocessing.Lock): Lock serializing HDA requests of all processes, as they
+            download and extract files in the same folders.
+    """
+    from ucgrassland import get_wekeo_data
+
+    logger_config.log_to_queue(log_queue)
+    get_wekeo_data.HDA_REQUEST_LOCK = hda_request_lock
+
+
 def prep_grassland_model_input_data(
     coordinates_list,
     first_year,
@@ -265,6 +590,10 @@ def prep_grassland_model_input_data(
     skip_weather=False,
     skip_soil=False,
     skip_management=False,
+    force=False,
+    require_grassland=False,
+    strict_grassland=False,
+    max_workers=4,
 ):
     """
     Prepare all necessary data to be used as grassland model input.
@@ -279,6 +608,13 @@ def prep_grassland_model_input_data(
         skip_weather (bool): Skip weather data preparation (default is False).
         skip_soil (bool): Skip soil data preparation (default is False).
         skip_management (bool): Skip management data preparation (default is False).
+        force (bool): Prepare data again even if output files already exist (default is False).
+        require_grassland (bool): Prepare weather, soil and management data only for locations classified
+            as grassland by at least one land cover map (default is False).
+        strict_grassland (bool): Skip all years of 'GER_Lange' and 'GER_Schwieder' management maps if location is
+            no grassland in first year with map (default is False).
+        max_workers (int): Maximum number of parallel requests, shared by all sites if eLTER sites are
+            prepared in parallel processes (default is 4).
     """
     if first_year and last_year:
         first_year = int(first_year)
@@ -290,7 +626,7 @@ def prep_grassland_model_input_data(
             )
             last_year = first_year
 
-        years = list(range(first_year, last_year + 1))
+        years = range(first_year, last_year + 1)
     else:
         years = None
 
@@ -302,6 +638,10 @@ def prep_grassland_model_input_data(
             skip_weather=skip_weather,
             skip_soil=skip_soil,
             skip_management=skip_management,
+            force=force,
+            require_grassland=require_grassland,
+            strict_grassland=strict_grassland,
+            max_workers=max_workers,
         )
     elif years and deims_id:
         location = ut.get_deims_coordinates(deims_id)
@@ -314,6 +654,10 @@ def prep_grassland_model_input_data(
                 skip_weather=skip_weather,
                 skip_soil=skip_soil,
                 skip_management=skip_management,
+                force=force,
+                require_grassland=require_grassland,
+                strict_grassland=strict_grassland,
+                max_workers=max_workers,
             )
         else:
             try:
@@ -400,34 +744,62 @@ def prep_grassland_model_input_data(
         #     "4ac03ec3-39d9-4ca1-a925-b6c1ae80c90d",  # Hochschwab (AT-HSW) GLORIA
         # ]
 
+        # Check all sites before starting, prepare each site once, sites without observation
+        # data specs cannot be prepared
+        site_ids = list(dict.fromkeys(site_ids))
+        missing_site_ids = [
+            deims_id
+            for deims_id in site_ids
+            if deims_id not in OBSERVATION_DATA_SPECS_PER_SITE
+        ]
+
+        if missing_site_ids:
+            logger.warning(
+                f"No observation data specifications found for sites {missing_site_ids}. Sites skipped."
+            )
+            site_ids = [
+                deims_id for deims_id in site_ids if deims_id not in missing_site_ids
+            ]
+
         # Get the last full year from now
         last_year = datetime.now().year - 1
 
-        for deims_id in site_ids:
-            station_file = (
-                source_folder
-                / deims_id
-                / OBSERVATION_DATA_SPECS_PER_SITE[deims_id]["station_file"]
-            )
-            coordinates_list = ut.get_plot_locations_from_csv(
-                station_file,
-                deims_id=deims_id if deims_id not in ["KUL-site"] else None,
+        # Sites are independent (own locations and output folders), prepare them in parallel processes,
+        # share maximum number of parallel requests between processes
+        process_count = max(1, min(len(site_ids), os.cpu_count() or 1, max_workers))
+        site_args = [
+            (
+                deims_id,
+                source_folder,
+                last_year,
+                skip_grass_check,
+                skip_weather,
+                skip_soil,
+                skip_management,
+                force,
+                require_grassland,
+                strict_grassland,
+                max(1, max_workers // process_count),
             )
+            for deims_id in site_ids
+        ]
 
-            # Specify site-specific time range, 1951 min year because dataset starts 1950 and last month of previous year needed
-            first_year = max(
-                1951, OBSERVATION_DATA_SPECS_PER_SITE[deims_id]["start_year"] - 10
-            )
-            years = list(range(first_year, last_year + 1))
+        # Only the main process writes the log file, site processes send their log records
+        log_queue = multiprocessing.Queue()
+        log_listener = QueueListener(
+            log_queue, *logger.handlers, respect_handler_level=True
+        )
+        log_listener.start()
 
-            get_input_data(
-                coordinates_list,
-                years,
-                skip_grass_check=skip_grass_check,
-                skip_weather=skip_weather,
-                skip_soil=skip_soil,
-                skip_management=skip_management,
-            )
+        try:
+            with multiprocessing.Pool(
+                processes=process_count,
+                initializer=init_site_process,
+                initargs=(log_queue, multiprocessing.Lock()),
+            ) as pool:
+                pool.starmap(get_site_input_data, site_args)
+        finally:
+            log_listener.stop()
 
 
 def main():
@@ -441,8 +813,9 @@ def main():
     # Define command-line arguments
     parser.add_argument(
         "--coordinates_list",
-        type=list,
-        help="List of coordinates dictionaries with 'lat' and 'lon' keys.",
+        type=ut.parse_locations,
+        help="List of location dictionaries containing coordinates ('lat', 'lon') or DEIMS IDs ('deims_id'), "
+        "given as 'lat,lon;lat,lon;deims_id'.",
     )
     parser.add_argument(
         "--first_year",
@@ -475,6 +848,28 @@ def main():
         action="store_true",
         help="Skip management data preparation (default is False).",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Prepare data again even if output files already exist (default is False).",
+    )
+    parser.add_argument(
+        "--require_grassland",
+        action="store_true",
+        help="Prepare weather, soil and management data only for grassland locations (default is False).",
+    )
+    parser.add_argument(
+        "--strict_grassland",
+        action="store_true",
+        help="Skip all years of German management maps for locations that are no grassland in first year with map "
+        "(default is False).",
+    )
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=4,
+        help="Maximum number of parallel requests (default is 4).",
+    )
     args = parser.parse_args()
     prep_grassland_model_input_data(
         coordinates_list=args.coordinates_list,
@@ -485,6 +880,10 @@ def main():
         skip_weather=args.skip_weather,
         skip_soil=args.skip_soil,
         skip_management=args.skip_management,
+        force=args.force,
+        require_grassland=args.require_grassland,
+        strict_grassland=args.strict_grassland,
+        max_workers=args.max_workers,
     )
 
 
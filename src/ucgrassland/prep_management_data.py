@@ -67,6 +67,9 @@ Data sources:
 
 import argparse
 import calendar
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from types import MappingProxyType
 
@@ -80,22 +83,22 @@ from ucgrassland.logger_config import logger
 # Define specific days for each number of mow events (cf. Filipiak et al. 2022, Table S6)
 DEFAULT_MOWING_DAYS = MappingProxyType(
     {
-        1: [213],  # 08-01
-        2: [121, 244],  # 05-01, 09-01
-        3: [121, 182, 244],  # 05-01, 07-01, 09-01
-        4: [105, 166, 213, 274],  # 04-15, 06-15, 08-01, 10-01
-        5: [91, 135, 182, 227, 288],  # 04-01, 05-15, 07-01, 08-15, 10-15
+        1: (213,),  # 08-01
+        2: (121, 244),  # 05-01, 09-01
+        3: (121, 182, 244),  # 05-01, 07-01, 09-01
+        4: (105, 166, 213, 274),  # 04-15, 06-15, 08-01, 10-01
+        5: (91, 135, 182, 227, 288),  # 04-01, 05-15, 07-01, 08-15, 10-15
     }
 )
 
 # Define specific days for each number of fertilisation events (cf. Filipiak et al. 2022, Table S6)
 DEFAULT_FERTILISATION_DAYS = MappingProxyType(
     {
-        1: [91],  # 04-01
-        2: [91, 166],  # 04-01, 06-15
-        3: [74, 135, 196],  # 03-15, 05-15, 07-15
-        4: [60, 121, 182, 227],  # 03-01, 05-01, 07-01, 08-15
-        5: [60, 105, 152, 196, 244],  # 03-01, 04-15, 06-01, 07-15, 09-01
+        1: (91,),  # 04-01
+        2: (91, 166),  # 04-01, 06-15
+        3: (74, 135, 196),  # 03-15, 05-15, 07-15
+        4: (60, 121, 182, 227),  # 03-01, 05-01, 07-01, 08-15
+        5: (60, 105, 152, 196, 244),  # 03-01, 04-15, 06-01, 07-15, 09-01
     }
 )
 
@@ -103,11 +106,11 @@ DEFAULT_FERTILISATION_DAYS = MappingProxyType(
 # 2025-12-12: amounts adjusted to not exceed total of 17 g/m² per year (seems the limit from DüV for all kinds of fertilizers)
 DEFAULT_FERTILISATION_AMOUNTS = MappingProxyType(
     {  # in g/m²
-        1: [5.5],
-        2: [6.5, 3.5],
-        3: [10.5, 3.25, 3.25],  # Filipiak: [12.5, 3.25, 3.25]
-        4: [9, 4, 2, 2],  # Filipiak: [16.5, 4, 2, 2]
-        5: [7, 2.5, 2.5, 2.5, 2.5],  # Filipiak: [21, 2.5, 2.5, 2.5, 2.5]
+        1: (5.5,),
+        2: (6.5, 3.5),
+        3: (10.5, 3.25, 3.25),  # Filipiak: [12.5, 3.25, 3.25]
+        4: (9, 4, 2, 2),  # Filipiak: [16.5, 4, 2, 2]
+        5: (7, 2.5, 2.5, 2.5, 2.5),  # Filipiak: [21, 2.5, 2.5, 2.5, 2.5]
     }
 )
 
@@ -115,12 +118,37 @@ DEFAULT_FERTILISATION_AMOUNTS = MappingProxyType(
 # resulting from DEFAULT_MOWING_DAYS - DEFAULT_FERTILISATION_DAYS
 DEFAULT_FERTILISATION_DAYS_AHEAD_OF_MOWING = MappingProxyType(
     {
-        0: [],  # allow empty mow day lists
-        1: [122],
-        2: [30, 78],
-        3: [47, 47, 48],
-        4: [45, 45, 31, 47],
-        5: [31, 30, 30, 31, 44],
+        0: (),  # allow empty mow day lists
+        1: (122,),
+        2: (30, 78),
+        3: (47, 47, 48),
+        4: (45, 45, 31, 47),
+        5: (31, 30, 30, 31, 44),
+    }
+)
+
+# Define Mendeley dataset URL and file IDs of 'GER_Lange' maps per (year, area-of-applicability map, property)
+GER_LANGE_MAP_FILES_URL = (
+    "https://data.mendeley.com/public-files/datasets/m9rrv26dvf/files/"
+)
+GER_LANGE_MAP_FILE_IDS = MappingProxyType(
+    {
+        (2017, True, "mowing"): "98d7c7ab-0a8f-4c2f-a78f-6c1739ee9354",
+        (2017, True, "fertilisation"): "7a4b70a9-95b3-4a06-ae8b-082184144494",
+        (2017, True, "grazing"): "e83a9d4a-ea55-44dd-b3fb-2ee7cb046e92",
+        (2017, True, "LUI"): "4e7ab052-bd47-4ccf-9560-57ceb080945a",
+        (2017, False, "mowing"): "14a1d2b6-11c8-4e31-ac19-45a7b805428d",
+        (2017, False, "fertilisation"): "deaca5bf-8999-4ccf-beac-ab47210051f6",
+        (2017, False, "grazing"): "611798da-e43d-4de6-9ff5-d5fb562fbf46",
+        (2017, False, "LUI"): "54995bd6-2811-4198-ba55-675386510260",
+        (2018, True, "mowing"): "d871429a-b2a6-4592-b3e5-4650462a9ac3",
+        (2018, True, "fertilisation"): "3b24279c-e9ab-468d-86b8-fe1fadc121bf",
+        (2018, True, "grazing"): "69701524-ed47-4e4b-9ef2-e355f5103d76",
+        (2018, True, "LUI"): "0efe31de-1275-4cab-b470-af1ce9f28363",
+        (2018, False, "mowing"): "0eb6a466-417b-4b30-b5f8-070c3f2c99c3",
+        (2018, False, "fertilisation"): "aa81ef4f-4ed4-489a-9d52-04d1fd3a357a",
+        (2018, False, "grazing"): "2bc29d3f-08d1-4508-a0ca-c83517216f69",
+        (2018, False, "LUI"): "28b419a6-c282-42fa-a23a-72676a288171",
     }
 )
 
@@ -135,7 +163,7 @@ def construct_management_data_file_name(
     file_suffix=".txt",
 ):
     """
-    Construct management data file name and create folder if missing.
+    Construct management data file name (folder is created when writing the file).
 
     Parameters:
         coordinates (dict): Dictionary with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
@@ -148,11 +176,10 @@ def construct_management_data_file_name(
     Returns:
         Path: Constructed data file name as a Path object.
     """
-    # Get folder with path appropriate for different operating systems, create folder if missing
+    # Get folder with path appropriate for different operating systems
     folder = Path(folder)
-    folder.mkdir(parents=True, exist_ok=True)
 
-    if "lat" in coordinates and "lon" in coordinates:
+    if isinstance(coordinates, dict) and "lat" in coordinates and "lon" in coordinates:
         formatted_lat = f"lat{coordinates['lat']:.6f}"
         formatted_lon = f"lon{coordinates['lon']:.6f}"
         formatted_years = f"{years[0]}-01-01_{years[-1]}-12-31"
@@ -245,15 +272,16 @@ def management_data_to_txt_file(
         if not management_data:
             management_data = np.empty((0, len(management_columns)), dtype=str)
 
+    # Format all lines first, large write buffer to write file in few system calls
+    lines = ["\t".join(management_columns)]
+    lines.extend(management_fmt % tuple(row) for row in management_data)
     file_name.parent.mkdir(parents=True, exist_ok=True)
-    np.savetxt(
-        file_name,
-        management_data,
-        delimiter="\t",
-        fmt=management_fmt,
-        header="\t".join(management_columns),
-        comments="",
-    )
+
+    with open(
+        file_name, "w", buffering=1 << 16, newline="\n", encoding="utf-8"
+    ) as file:
+        file.write("\n".join(lines) + "\n")
+
     logger.info(log_message)
 
     if data_query_protocol:
@@ -263,6 +291,22 @@ def management_data_to_txt_file(
         )
 
 
+@lru_cache(maxsize=512)
+def check_management_map_url(map_file):
+    """
+    Check if a management map file exists at specified URL, results are cached per URL.
+
+    Missing files are cached as well, so repeated requests for unavailable maps skip the probe.
+
+    Parameters:
+        map_file (str): URL of the management map file.
+
+    Returns:
+        str: URL if existing (original or redirected), None otherwise.
+    """
+    return ut.check_url(map_file)
+
+
 def get_management_map_file(
     map_key, year, *, property="mowing", applicability=False, cache=None
 ):
@@ -296,48 +340,13 @@ def get_management_map_file(
                     f"Local file '{map_file}' not found. Trying to access via URL ..."
                 )
 
-        # Nested dictionary for file names
-        file_names = {
-            2017: {
-                True: {
-                    "mowing": "98d7c7ab-0a8f-4c2f-a78f-6c1739ee9354",
-                    "fertilisation": "7a4b70a9-95b3-4a06-ae8b-082184144494",
-                    "grazing": "e83a9d4a-ea55-44dd-b3fb-2ee7cb046e92",
-                    "LUI": "4e7ab052-bd47-4ccf-9560-57ceb080945a",
-                },
-                False: {
-                    "mowing": "14a1d2b6-11c8-4e31-ac19-45a7b805428d",
-                    "fertilisation": "deaca5bf-8999-4ccf-beac-ab47210051f6",
-                    "grazing": "611798da-e43d-4de6-9ff5-d5fb562fbf46",
-                    "LUI": "54995bd6-2811-4198-ba55-675386510260",
-                },
-            },
-            2018: {
-                True: {
-                    "mowing": "d871429a-b2a6-4592-b3e5-4650462a9ac3",
-                    "fertilisation": "3b24279c-e9ab-468d-86b8-fe1fadc121bf",
-                    "grazing": "69701524-ed47-4e4b-9ef2-e355f5103d76",
-                    "LUI": "0efe31de-1275-4cab-b470-af1ce9f28363",
-                },
-                False: {
-                    "mowing": "0eb6a466-417b-4b30-b5f8-070c3f2c99c3",
-                    "fertilisation": "aa81ef4f-4ed4-489a-9d52-04d1fd3a357a",
-                    "grazing": "2bc29d3f-08d1-4508-a0ca-c83517216f69",
-                    "LUI": "28b419a6-c282-42fa-a23a-72676a288171",
-                },
-            },
-        }
+        file_name = GER_LANGE_MAP_FILE_IDS.get((year, applicability, property))
 
-        try:
-            file_name = file_names[year][applicability][property]
-        except KeyError:
+        if file_name is None:
             logger.warning(f"'{map_key}' {property} map not available for {year}.")
             return None
 
-        map_file = (
-            f"https://data.mendeley.com/public-files/datasets/m9rrv26dvf/files/"
-            f"{file_name}/file_downloaded"
-        )
+        map_file = f"{GER_LANGE_MAP_FILES_URL}{file_name}/file_downloaded"
     elif map_key == "GER_Schwieder":
         if year in [2017, 2018, 2019, 2020, 2021]:
             file_name = f"GLU_GER_{year}_SUM_DOY_COG.tif"
@@ -382,16 +391,81 @@ def get_management_map_file(
             return None
 
     # Return map file URL, if found
-    if ut.check_url(map_file):
+    if check_management_map_url(map_file):
         return map_file
     else:
         logger.error(f"File '{map_file}' not found. Returning None.")
         return None
 
 
-def get_GER_Lange_data(coordinates, years):
+def read_GER_Lange_maps(coordinates_list, years, map_properties, *, max_workers=8):
     """
-    Read management data for given coordinates from 'GER_Lange' map for respective year and return as array.
+    Read values of 'GER_Lange' maps and their area-of-applicability (AOA) maps for multiple locations.
+    Each map file is opened only once for all locations, maps of all years and properties are read concurrently.
+
+    Parameters:
+        coordinates_list (list of dict): List of coordinates dictionaries ({'lat': float, 'lon': float}).
+        years (list): List of years to process.
+        map_properties (list of str): List of map properties ('mowing', 'fertilisation', 'grazing', 'LUI').
+        max_workers (int): Maximum number of map files read in parallel (default is 8).
+
+    Returns:
+        dict: Readings per (year, property), each as tuple of map file, AOA file, AOA values and map values
+            (values as tuple of list of values per location and time stamp, None if file not found or not read,
+            map file is not checked if no location is within AOA).
+    """
+    map_key = "GER_Lange"
+
+    def _read_property(year, property):
+        # Get map files and raster values of one year and property, AOA map first
+        aoa_file = get_management_map_file(
+            map_key, year, property=property, applicability=True
+        )
+
+        if not aoa_file:
+            return None, None, None, None
+
+        aoa_values = ut.extract_raster_values(aoa_file, coordinates_list)
+
+        # No location within AOA (value 0) or grassland (value -1), skip map file
+        if all(value in (-1, 0) for value in aoa_values[0]):
+            return None, aoa_file, aoa_values, None
+
+        map_file = get_management_map_file(
+            map_key, year, property=property, applicability=False
+        )
+
+        if not map_file:
+            return None, aoa_file, aoa_values, None
+
+        return (
+            map_file,
+            aoa_file,
+            aoa_values,
+            ut.extract_raster_values(map_file, coordinates_list),
+        )
+
+    year_property_pairs = [
+        (year, property) for year in years for property in map_properties
+    ]
+
+    # Requests for all years and properties are independent, send them concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        property_readings = executor.map(
+            _read_property,
+            [year for year, _ in year_property_pairs],
+            [property for _, property in year_property_pairs],
+        )
+
+        return dict(zip(year_property_pairs, property_readings))
+
+
+def get_GER_Lange_data_for_locations(
+    coordinates_list, years, *, strict_grassland=False, max_workers=8
+):
+    """
+    Read management data for multiple locations from 'GER_Lange' map for respective year and return as arrays.
+    Each map file is read only once for all locations.
     Only works for locations classified as grassland according to German ATKIS digital landscape model 2015.
 
     Properties:
@@ -404,51 +478,120 @@ def get_GER_Lange_data(coordinates, years):
         Each property's model has a separate area of applicability for each year.
 
     Parameters:
-        coordinates (tuple): Coordinates ('lat', 'lon') to extract management data.
+        coordinates_list (list of dict): List of coordinates dictionaries ({'lat': float, 'lon': float}).
         years (list): List of years to process.
+        strict_grassland (bool): Skip all years for locations that are no grassland in first year with maps
+            (default is False).
+        max_workers (int): Maximum number of map files read in parallel (default is 8).
 
     Returns:
-        tuple: Property data for given years (2D numpy.ndarray, nan if no grassland or outside area of applicability),
-            , list of query sources and time stamps, and list of map properties.
+        list of tuple: For each location, property data for given years (2D numpy.ndarray, nan if no grassland
+            or outside area of applicability), list of query sources and time stamps, and list of map properties.
     """
     map_key = "GER_Lange"
     map_properties = ["mowing", "fertilisation", "grazing", "LUI"]
     logger.info(f"Reading management data from '{map_key}' map ...")
-    query_protocol = []
 
-    # Initialize property_data array with nans
-    property_data = np.full((len(years), len(map_properties) + 1), np.nan, dtype=float)
-    warn_no_grassland = True
-
-    # Extract values from tif maps for each year and each property
-    for y_index, year in enumerate(years):
-        # Add year to management data
-        property_data[y_index, 0] = year
+    # Readings per location index, each as dictionary of readings per (year, property)
+    property_readings = [{} for _ in coordinates_list]
+    location_indices = list(range(len(coordinates_list)))
+    years_to_read = list(years)
+
+    def _add_readings(readings, indices):
+        # Split readings of a list of locations into readings per location
+        for (year, property), (
+            map_file,
+            aoa_file,
+            aoa_values,
+            map_values,
+        ) in readings.items():
+            for values_index, location_index in enumerate(indices):
+                property_readings[location_index][(year, property)] = (
+                    map_file,
+                    aoa_file,
+                    (aoa_values[0][values_index], aoa_values[1])
+                    if aoa_values
+                    else None,
+                    (map_values[0][values_index], map_values[1])
+                    if map_values
+                    else None,
+                )
 
-        # Add management properties from tif maps
-        for p_index, property in enumerate(map_properties, start=1):
-            # Extract property value
-            map_file = get_management_map_file(
-                map_key, year, property=property, applicability=False
+    if strict_grassland:
+        # Read years in order until maps are found, skip all years for locations that are no grassland there
+        while years_to_read and location_indices:
+            year = years_to_read.pop(0)
+            year_readings = read_GER_Lange_maps(
+                [coordinates_list[index] for index in location_indices],
+                [year],
+                map_properties,
+                max_workers=max_workers,
             )
+            _add_readings(year_readings, location_indices)
+            aoa_values = [
+                readings[2] for readings in year_readings.values() if readings[2]
+            ]
 
-            if map_file:
-                logger.info(
-                    f"{property[0].upper() + property[1:]} map for {year} found. Using '{map_file}'."
-                )
+            # Map availability does not depend on location, stop at first year with maps
+            if aoa_values:
+                grassland_indices = []
+
+                for values_index, location_index in enumerate(location_indices):
+                    if any(values[0][values_index] == -1 for values in aoa_values):
+                        coordinates = coordinates_list[location_index]
+                        logger.info(
+                            f"Location (latitude: {coordinates['lat']}, longitude: {coordinates['lon']}) not classified"
+                            f" as grassland in '{map_key}' map for {year}. Skipping all other years."
+                        )
+                    else:
+                        grassland_indices.append(location_index)
+
+                location_indices = grassland_indices
+                break
+
+    if years_to_read and location_indices:
+        _add_readings(
+            read_GER_Lange_maps(
+                [coordinates_list[index] for index in location_indices],
+                years_to_read,
+                map_properties,
+                max_workers=max_workers,
+            ),
+            location_indices,
+        )
+
+    # Capitalize first letter only (keep 'LUI'), once per property for logging
+    property_labels = {
+        property: property[0].upper() + property[1:] for property in map_properties
+    }
+    management_data = []
+
+    for location_readings in property_readings:
+        query_protocol = []
+
+        # Initialize property_data array with nans
+        property_data = np.full(
+            (len(years), len(map_properties) + 1), np.nan, dtype=float
+        )
+        warn_no_grassland = True
+
+        # Extract values from tif maps for each year and each property
+        for y_index, year in enumerate(years):
+            # Add year to management data
+            property_data[y_index, 0] = year
 
-                # Extract and check AOA value
-                aoa_file = get_management_map_file(
-                    map_key, year, property=property, applicability=True
+            # Add management properties from tif maps
+            for p_index, property in enumerate(map_properties, start=1):
+                map_file, aoa_file, aoa_value, map_value = location_readings.get(
+                    (year, property), (None, None, None, None)
                 )
 
+                # Check AOA value first, property map is only read within AOA
                 if aoa_file:
                     logger.info(
-                        f"{property[0].upper() + property[1:]} map AOA for {year} found. Using '{aoa_file}'."
-                    )
-                    within_aoa, time_stamp = ut.extract_raster_value(
-                        aoa_file, coordinates
+                        f"{property_labels[property]} map AOA for {year} found. Using '{aoa_file}'."
                     )
+                    within_aoa, time_stamp = aoa_value
                     query_protocol.append([aoa_file, time_stamp])
 
                     if within_aoa == -1:
@@ -459,25 +602,49 @@ def get_GER_Lange_data(coordinates, years):
                             warn_no_grassland = False
                         break
 
-                    property_value, time_stamp = ut.extract_raster_value(
-                        map_file, coordinates
-                    )
-                    query_protocol.append([map_file, time_stamp])
-
-                    if within_aoa:
+                    if not within_aoa:
+                        logger.warning(
+                            f"{year}, {property} : not used, outside area of applicability."
+                        )
+                    elif map_file:
+                        logger.info(
+                            f"{property_labels[property]} map for {year} found. Using '{map_file}'."
+                        )
+                        property_value, time_stamp = map_value
+                        query_protocol.append([map_file, time_stamp])
                         logger.info(
                             f"{year}, {property} : {property_value}. Within area of applicability."
                         )
                         property_data[y_index, p_index] = property_value
-                    else:
-                        logger.warning(
-                            f"{year}, {property} : {property_value}. Not used, outside area of applicability."
-                        )
 
-    return property_data, query_protocol, map_properties
+        management_data.append((property_data, query_protocol, map_properties))
+
+    return management_data
 
 
-def get_GER_Schwieder_data(coordinates, years):
+def get_GER_Lange_data(coordinates, years, *, strict_grassland=False, max_workers=8):
+    """
+    Read management data for given coordinates from 'GER_Lange' map for respective year and return as array.
+    See get_GER_Lange_data_for_locations for map properties.
+
+    Parameters:
+        coordinates (tuple): Coordinates ('lat', 'lon') to extract management data.
+        years (list): List of years to process.
+        strict_grassland (bool): Skip all years if location is no grassland in first year with maps (default is False).
+        max_workers (int): Maximum number of map files read in parallel (default is 8).
+
+    Returns:
+        tuple: Property data for given years (2D numpy.ndarray, nan if no grassland or outside area of applicability),
+            , list of query sources and time stamps, and list of map properties.
+    """
+    return get_GER_Lange_data_for_locations(
+        [coordinates], years, strict_grassland=strict_grassland, max_workers=max_workers
+    )[0]
+
+
+def get_GER_Schwieder_data(
+    coordinates, years, *, strict_grassland=False, max_workers=8
+):
     """
     Read mowing data for given coordinates from 'GER_Schwieder' map for respective year and return as array.
     Only works for locations classified as (permanent) grassland in 2017, 2018 and 2019 according to Blickensdörfer et al. (2021).
@@ -488,6 +655,8 @@ def get_GER_Schwieder_data(coordinates, years):
     Parameters:
         coordinates (tuple): Coordinates ('lat', 'lon') to extract management data.
         years (list of int): List of years to process.
+        strict_grassland (bool): Skip all years if location is no grassland in first year with map (default is False).
+        max_workers (int): Maximum number of map files read in parallel (default is 8).
 
     Returns:
         tuple: Property data for given years (2D numpy.ndarray, nan if no grassland or no mowing event),
@@ -509,15 +678,57 @@ def get_GER_Schwieder_data(coordinates, years):
     query_protocol = []
 
     # Initialize property_data array with nans
-    property_data = np.full((len(years), map_bands + 1), np.nan, dtype=object)
+    property_data = np.full((len(years), map_bands + 1), np.nan, dtype=float)
     warn_no_grassland = True
     no_grassland_value = -9999
 
+    def _read_year(year):
+        # Get map file and raster values (mowing events and dates) of one year
+        map_file = get_management_map_file(map_key, year)
+
+        if not map_file:
+            return None, [], None
+
+        # Read all bands with one opening of the map file
+        band_values, time_stamp = ut.extract_raster_band_values(
+            map_file, coordinates, band_numbers=list(range(1, map_bands + 1))
+        )
+
+        return map_file, band_values, time_stamp
+
+    year_readings = [(None, [], None)] * len(years)
+    year_indices_to_read = list(range(len(years)))
+
+    if strict_grassland:
+        # Read years in order until a map is found, skip all years if location is no grassland there
+        while year_indices_to_read:
+            y_index = year_indices_to_read.pop(0)
+            year_readings[y_index] = _read_year(years[y_index])
+            map_file, band_values, _ = year_readings[y_index]
+
+            if map_file:
+                if band_values[0] == no_grassland_value:
+                    logger.info(
+                        f"Location not classified as grassland in '{map_key}' map for {years[y_index]}."
+                        " Skipping all other years."
+                    )
+                    year_indices_to_read = []
+                break
+
+    # Requests for all years are independent, send them concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for y_index, readings in zip(
+            year_indices_to_read,
+            executor.map(_read_year, [years[i] for i in year_indices_to_read]),
+        ):
+            year_readings[y_index] = readings
+
     # Extract values from tif maps for each year and each property
-    for y_index, year in enumerate(years):
+    for y_index, (year, (map_file, band_values, time_stamp)) in enumerate(
+        zip(years, year_readings)
+    ):
         # Add year to management data
         property_data[y_index, 0] = year
-        map_file = get_management_map_file(map_key, year)
 
         if map_file:
             logger.info(
@@ -526,9 +737,7 @@ def get_GER_Schwieder_data(coordinates, years):
 
             # Read mowing events (band 1)
             band_index = 1
-            band_value, time_stamp = ut.extract_raster_value(
-                map_file, coordinates, band_number=band_index
-            )
+            band_value = band_values[0]
             query_protocol.append([map_file, time_stamp])
 
             if band_value == no_grassland_value:
@@ -542,11 +751,7 @@ def get_GER_Schwieder_data(coordinates, years):
                 logger.info(f"{year}, {property}: {band_value} event(s).")
 
                 # Add mowing dates if available (bands 2 to end)
-                for band_index in range(2, map_bands + 1):
-                    band_value, time_stamp = ut.extract_raster_value(
-                        map_file, coordinates, band_number=band_index
-                    )
-
+                for band_index, band_value in enumerate(band_values[1:], start=2):
                     if band_value != 0:
                         property_data[y_index, band_index] = band_value
                         query_protocol.append([map_file, time_stamp])
@@ -832,7 +1037,7 @@ def get_mow_events(
         leap_year_considered (bool): Whether leap year was already considered for mow_days (default is True).
 
     Returns:
-        list of list: list of mowing events in grassland model management input data format,
+        numpy.ndarray: Array with mowing events in grassland model management input data format,
         one row for each mow_day, containing:
             column 0: date string in format YYYY-MM-DD.
             column 1: value of mow_height.
@@ -840,20 +1045,12 @@ def get_mow_events(
             column 7: 'data_source' string to specify data source.
     """
     # Create result array, date and mow height in first rows, NaN for all other management rows
-    mow_events = []
-    for day_of_year in mow_days:
-        mow_date = ut.day_of_year_to_date(year, day_of_year, leap_year_considered)
-        row = [
-            mow_date.strftime("%Y-%m-%d"),
-            mow_height,
-            "NaN",
-            "NaN",
-            "NaN",
-            "NaN",
-            "NaN",
-            data_source,
-        ]
-        mow_events.append(row)
+    mow_events = np.full((len(mow_days), 8), "NaN", dtype=object)
+    mow_events[:, 0] = ut.days_of_year_to_date_strings(
+        year, mow_days, leap_year_considered
+    )
+    mow_events[:, 1] = mow_height
+    mow_events[:, 7] = data_source
 
     return mow_events
 
@@ -876,7 +1073,7 @@ def get_mow_schedule(year, mow_count, data_source, mow_height=0.07):
             columns 2 to 6: value NaN (for no fertilisation, no irrigation and no seeds at this management event).
             column 7: 'data_source' string to specify data source.
     """
-    if np.isnan(mow_count):
+    if math.isnan(mow_count):
         logger.warning("mow_count is NaN. No schedule will be generated.")
 
         return np.array([])
@@ -943,22 +1140,16 @@ def get_fert_days(mow_days, year):
     )
 
     # Calculate fertilisation dates using specific days ahead of corresponding mow events
-    fert_days = []
-
-    for index, mow_day in enumerate(mow_days):
-        fert_day = mow_day - deltas[index]
+    fert_days = np.asarray(mow_days, dtype=int) - np.asarray(deltas, dtype=int)
 
-        if fert_day < earliest_fert_day:
-            logger.warning(
-                "Calculated fertilisation date"
-                f" {ut.day_of_year_to_date(year, fert_day).strftime('%Y-%m-%d')}"
-                f" is before earliest date allowed. Set to {earliest_fert_date_str}."
-            )
-            fert_day = earliest_fert_day
-
-        fert_days.append(fert_day)
+    for fert_day in fert_days[fert_days < earliest_fert_day]:
+        logger.warning(
+            "Calculated fertilisation date"
+            f" {ut.day_of_year_to_date(year, int(fert_day)).strftime('%Y-%m-%d')}"
+            f" is before earliest date allowed. Set to {earliest_fert_date_str}."
+        )
 
-    return fert_days
+    return np.maximum(fert_days, earliest_fert_day).tolist()
 
 
 def fert_days_from_mow_days(mow_days_per_year, years):
@@ -974,13 +1165,10 @@ def fert_days_from_mow_days(mow_days_per_year, years):
     Returns:
         list of list: List of lists with day of year for each fertilisation event for each year.
     """
-    fert_days_per_year = []
-
-    for index, year in enumerate(years):
-        fert_days = get_fert_days(mow_days_per_year[index], year)
-        fert_days_per_year.append(fert_days)
-
-    return fert_days_per_year
+    return [
+        get_fert_days(mow_days, year)
+        for mow_days, year in zip(mow_days_per_year, years)
+    ]
 
 
 def get_fert_schedule(year, fert_count, data_source, fert_days=None):
@@ -1002,7 +1190,7 @@ def get_fert_schedule(year, fert_count, data_source, fert_days=None):
             columns 3 to 6: value NaN (for no irrigation and no seeds at this management event).
             column 7: 'data_source' string to specify data source.
     """
-    if np.isnan(fert_count):
+    if math.isnan(fert_count):
         logger.warning("fert_count is NaN. No schedule will be generated.")
 
         return np.array([])
@@ -1048,21 +1236,10 @@ def get_fert_schedule(year, fert_count, data_source, fert_days=None):
             fert_days = [day + 1 for day in fert_days]  # Adjust for leap year
 
     # Create result array, date in first row, fertilisation amount in third row, NaN for all other management rows
-    fert_events = []
-
-    for d_index, day_of_year in enumerate(fert_days):
-        fert_date = ut.day_of_year_to_date(year, day_of_year)
-        row = [
-            fert_date.strftime("%Y-%m-%d"),
-            "NaN",
-            DEFAULT_FERTILISATION_AMOUNTS[fert_count][d_index],
-            "NaN",
-            "NaN",
-            "NaN",
-            "NaN",
-            data_source,
-        ]
-        fert_events.append(row)
+    fert_events = np.full((len(fert_days), 8), "NaN", dtype=object)
+    fert_events[:, 0] = ut.days_of_year_to_date_strings(year, fert_days)
+    fert_events[:, 2] = DEFAULT_FERTILISATION_AMOUNTS[fert_count][: len(fert_days)]
+    fert_events[:, 7] = data_source
 
     return fert_events
 
@@ -1081,7 +1258,7 @@ def convert_management_data(
     Convert raw management data into structured mowing and fertilisation events.
 
     Parameters:
-        management_data_raw (list of list): Raw management data containing yearly mowing and fertilisation info.
+        management_data_raw (numpy.ndarray or list of list): Raw management data containing yearly mowing and fertilisation info.
         coordinates (dict): Dictionary with 'lat', 'lon' and 'altitude' keys ({'lat': float, 'lon': float, 'altitude': float}).
         map_key (str): Key to identify land use map ('GER_Lange' or 'GER_Schwieder').
         fill_mode (str): Method for completing missing data (default is 'mean').
@@ -1099,25 +1276,32 @@ def convert_management_data(
             column 7: 'data_source' string to specify data source.
     """
     management_events = []
-    years = np.array([int(entry[0]) for entry in management_data_raw])
+    management_data_raw = np.asarray(management_data_raw, dtype=float)
+    years = management_data_raw[:, 0].astype(int)
 
-    if map_key in [
+    # Check once which data the map provides
+    has_mow_counts = map_key in [
         "GER_Lange",
         "GER_Schwieder",
         "EUR_hda_mowing",
         "CZ_CVL",
         "IT_VMM",
         "AT_STB",
-    ]:
+    ]
+    has_fert_counts = map_key in ["GER_Lange", "IT_VMM", "AT_STB"]
+    has_mow_dates = map_key in ["GER_Schwieder", "EUR_hda_mowing", "CZ_CVL"]
+    fert_like_mowing = map_key in ["GER_Schwieder", "EUR_hda_mowing"]
+
+    if has_mow_counts:
         # Read mowing counts, same column for all map keys
-        mow_count_per_year = np.array([entry[1] for entry in management_data_raw])
+        mow_count_per_year = management_data_raw[:, 1].copy()
     else:
         # No map_key without mowing data implemented, just for safety and clarity
         mow_count_per_year = np.zeros_like(years)
 
-    if map_key in ["GER_Lange", "IT_VMM", "AT_STB"]:
+    if has_fert_counts:
         # Read fertilisation (counts or just boolean)
-        fertilised_per_year = np.array([entry[2] for entry in management_data_raw])
+        fertilised_per_year = management_data_raw[:, 2].copy()
     else:
         #
         fertilised_per_year = np.zeros_like(years)
@@ -1140,70 +1324,56 @@ def convert_management_data(
                 "but these are ignored."
             )
     else:
-        years_with_data_conflict = np.array([], dtype=int)
+        management_schedules = []
+        years_with_data_conflict = set()
         mow_days_per_year = [[] for _ in range(len(years))]
         fert_days_per_year = [[] for _ in range(len(years))]
         fert_source_per_year = np.full_like(years, "", dtype=object)
 
         # MOWING
-        if map_key in [
-            "GER_Lange",
-            "GER_Schwieder",
-            "EUR_hda_mowing",
-            "CZ_CVL",
-            "IT_VMM",
-            "AT_STB",
-        ]:
-            years_with_mow_data = years[~np.isnan(mow_count_per_year)]
-
-            if map_key in ["GER_Lange", "IT_VMM", "AT_STB"]:
-                # Add mowing events to management events, using default schedule
-                for index in np.where(mow_count_per_year > 0)[0]:
-                    mow_schedule = get_mow_schedule(
+        if has_fert_counts:
+            # Add mowing events to management events, using default schedule
+            for index in np.where(mow_count_per_year > 0)[0]:
+                mow_schedule = get_mow_schedule(
+                    years[index],
+                    mow_count_per_year[index],
+                    "event observed (date: schedule)",
+                    mow_height=mow_height,
+                )
+                management_schedules.append(mow_schedule)
+        elif has_mow_dates:
+            # Get specific mowing dates for each year with mowing, add to management events
+            for index in np.where(mow_count_per_year > 0)[0]:
+                mow_count = int(mow_count_per_year[index])
+                entry_dates = management_data_raw[index, 2:]
+                entry_dates = entry_dates[~np.isnan(entry_dates)].astype(int)
+
+                if len(entry_dates) != mow_count:
+                    logger.warning(
+                        f"Found {mow_count} mowing events for year {years[index]}, "
+                        f"but {len(entry_dates)} entries in corresponding mowing dates. "
+                        "Using default schedule for mowing dates instead."
+                    )
+                    # Mark year as conflicting, so dates will be filled later
+                    years_with_data_conflict.add(years[index])
+                else:
+                    mow_days_per_year[index] = entry_dates
+                    mow_events = get_mow_events(
                         years[index],
-                        mow_count_per_year[index],
-                        "event observed (date: schedule)",
+                        mow_days_per_year[index],
+                        "date observed",
                         mow_height=mow_height,
+                        leap_year_considered=True,
                     )
-                    management_events.extend(mow_schedule)
-            elif map_key in ["GER_Schwieder", "EUR_hda_mowing", "CZ_CVL"]:
-                # Get specific mowing dates for each year with mowing, add to management events
-                for index in np.where(mow_count_per_year > 0)[0]:
-                    mow_count = int(mow_count_per_year[index])
-                    entry_dates = [
-                        int(x)
-                        for x in management_data_raw[index][2:]
-                        if not np.isnan(x)
-                    ]
-
-                    if len(entry_dates) != mow_count:
-                        logger.warning(
-                            f"Found {mow_count} mowing events for year {years[index]}, "
-                            f"but {len(entry_dates)} entries in corresponding mowing dates. "
-                            "Using default schedule for mowing dates instead."
-                        )
-                        # Delete year from years_with_mow_data, so dates will be filled later
-                        years_with_mow_data = years_with_mow_data[
-                            years_with_mow_data != years[index]
-                        ]
-                        years_with_data_conflict = np.append(
-                            years_with_data_conflict, years[index]
-                        )
-                    else:
-                        mow_days_per_year[index] = entry_dates
-                        mow_events = get_mow_events(
-                            years[index],
-                            mow_days_per_year[index],
-                            "date observed",
-                            mow_height=mow_height,
-                            leap_year_considered=True,
-                        )
-                        management_events.extend(mow_events)
+                    management_schedules.append(mow_events)
 
         # Fill mowing for years without data
-        if any(np.isnan(mow_count_per_year)):
-            fill_mode = fill_mode.lower()
-            epsilon = 1e-10
+        fill_mode = fill_mode.lower()
+        epsilon = 1e-10
+        no_mow_data = np.isnan(mow_count_per_year)
+        mow_data_count = np.count_nonzero(~no_mow_data)
+
+        if no_mow_data.any():
             mow_count_fill = 0
             no_mow_data_for_mean = False
 
@@ -1213,12 +1383,12 @@ def convert_management_data(
                     "Completing management data with means from years with data ..."
                 )
 
-                if sum(~np.isnan(mow_count_per_year)) > 0:
-                    mow_count_float = np.nanmean(mow_count_per_year)
+                if mow_data_count > 0:
+                    mow_count_float = np.mean(mow_count_per_year[~no_mow_data])
                     mow_count_fill = round(mow_count_float + epsilon)
                     logger.info(
                         f"Mean annual mowing events: {mow_count_float:.4f} "
-                        f"(from {sum(~np.isnan(mow_count_per_year))} years). "
+                        f"(from {mow_data_count} years). "
                         f"Using {mow_count_fill} events per year."
                     )
                     data_source_str = (
@@ -1240,63 +1410,60 @@ def convert_management_data(
                 )
                 data_source_str = "event assumed (fill mode: default, date: schedule)"
 
-            mow_count_per_year[np.isnan(mow_count_per_year)] = mow_count_fill
-
-            # Add all remaining mowing events to schedule
-            for index, year in enumerate(years):
-                if mow_count_per_year[index] > 0 and year not in years_with_mow_data:
-                    source_str = (
-                        "event observed (date: not found, schedule)"
-                        if year in years_with_data_conflict
-                        else data_source_str
-                    )
+            mow_count_per_year[no_mow_data] = mow_count_fill
+            data_conflict = np.isin(years, list(years_with_data_conflict))
+
+            # Add all remaining mowing events (years without data or with conflicting dates) to schedule
+            for index in np.flatnonzero(
+                (no_mow_data | data_conflict) & (mow_count_per_year > 0)
+            ):
+                source_str = (
+                    "event observed (date: not found, schedule)"
+                    if data_conflict[index]
+                    else data_source_str
+                )
 
-                    mow_schedule = get_mow_schedule(
-                        year,
-                        mow_count_per_year[index],
-                        source_str,
-                        mow_height=mow_height,
-                    )
-                    management_events.extend(mow_schedule)
+                mow_schedule = get_mow_schedule(
+                    years[index],
+                    mow_count_per_year[index],
+                    source_str,
+                    mow_height=mow_height,
+                )
+                management_schedules.append(mow_schedule)
 
         # FERTILISATION
-        if map_key in ["GER_Lange", "IT_VMM", "AT_STB"]:
+        if has_fert_counts:
             if map_key == "GER_Lange":
-                # Read fertilisation data for "GER_Lange"
-                fertilised_per_year = np.array(
-                    [entry[2] for entry in management_data_raw]
-                )
-                fert_count_per_year = np.full(fertilised_per_year.shape, np.nan)
+                # Use fertilisation data for "GER_Lange" (fertilised or not)
+                fertilised = fertilised_per_year == 1
 
                 # If data say fertilisation, adapt number of events to mowing events (even if mowing==0)!
-                for index in np.where(fertilised_per_year == 1)[0]:
-                    fert_count_per_year[index] = mow_count_per_year[index]
-                    fert_source_per_year[index] = "event observed (date: schedule)"
-            elif map_key in ["IT_VMM", "AT_STB"]:
+                fert_count_per_year = np.where(fertilised, mow_count_per_year, np.nan)
+                fert_source_per_year[fertilised] = "event observed (date: schedule)"
+            else:
                 # Read fertilisation data for "IT_VMM" and "AT_STB"
                 # NOTE: entry[2] for all fertilisation, entry[3] for mineral fertilisation
                 #       entries can be non integer, e.g. 1.5
-                fert_count_per_year = np.array(
-                    [entry[2] for entry in management_data_raw]
-                )
+                fert_count_per_year = management_data_raw[:, 2].copy()
 
-                for index in np.where(fert_count_per_year > 0)[0]:
-                    fert_source_per_year[index] = "event observed (date: schedule)"
+                fert_source_per_year[fert_count_per_year > 0] = (
+                    "event observed (date: schedule)"
+                )
 
             # Fill fertilisation years without data
-            index_to_fill = np.where(np.isnan(fert_count_per_year))[0]
+            no_fert_data = np.isnan(fert_count_per_year)
+            fert_data_count = np.count_nonzero(~no_fert_data)
+            index_to_fill = np.flatnonzero(no_fert_data)
             no_fert_data_for_mean = False
 
             if fill_mode == "mean":
-                if np.any(~np.isnan(fert_count_per_year)):
+                if fert_data_count > 0:
                     # Use means of data retrieved for remaining years as well
-                    fert_count_float = np.mean(
-                        fert_count_per_year[~np.isnan(fert_count_per_year)]
-                    )
+                    fert_count_float = np.mean(fert_count_per_year[~no_fert_data])
                     fert_count_fill = round(fert_count_float + epsilon)
                     logger.info(
                         f"Mean annual fertilisation events: {fert_count_float:.4f} "
-                        f"(from {sum(~np.isnan(fert_count_per_year))} years). "
+                        f"(from {fert_data_count} years). "
                         f"Using {fert_count_fill} events per year (but never more than mowing events of the same year)."
                     )
 
@@ -1323,7 +1490,7 @@ def convert_management_data(
                 fert_source_per_year[index_to_fill] = (
                     "event assumed (fill mode: like mowing, date: schedule)"
                 )
-        elif map_key in ["GER_Schwieder", "EUR_hda_mowing"]:
+        elif fert_like_mowing:
             fert_count_per_year = np.zeros_like(mow_count_per_year)
 
             if fill_mode in ["mean", "default"]:
@@ -1339,22 +1506,20 @@ def convert_management_data(
                 )
 
         # Add all fertilisation events to schedule (no fertilization for CZ_CVL)
-        if map_key in [
-            "GER_Lange",
-            "GER_Schwieder",
-            "EUR_hda_mowing",
-            "IT_VMM",
-            "AT_STB",
-        ]:
-            for index, year in enumerate(years):
-                if fert_count_per_year[index] > 0:
-                    fert_schedule = get_fert_schedule(
-                        year,
-                        fert_count_per_year[index],
-                        fert_source_per_year[index],
-                        fert_days=fert_days_per_year[index],
-                    )
-                    management_events.extend(fert_schedule)
+        if has_fert_counts or fert_like_mowing:
+            for index in np.flatnonzero(fert_count_per_year > 0):
+                fert_schedule = get_fert_schedule(
+                    years[index],
+                    fert_count_per_year[index],
+                    fert_source_per_year[index],
+                    fert_days=fert_days_per_year[index],
+                )
+                management_schedules.append(fert_schedule)
+
+        # Collect events of all schedules in one list, sort by date
+        management_events = [
+            event for schedule in management_schedules for event in schedule
+        ]
 
         try:
             management_events.sort(key=lambda x: x[0])
@@ -1374,6 +1539,9 @@ def get_management_data(
     mow_height=0.07,
     elevation_limit=2000,
     file_name=None,
+    strict_grassland=False,
+    map_data=None,
+    max_workers=8,
 ):
     """
     Read management data from land use map. Write to .txt files.
@@ -1386,8 +1554,13 @@ def get_management_data(
         mow_height (float): Height of mowing (in meters, default is 0.07).
         elevation_limit (int): Elevation limit (in meters) above which no management events are assumed (default is 2000).
         file_name (str or Path): File name to save final management data (default is None, default file name used if not provided).
+        strict_grassland (bool): Skip all years of 'GER_Lange' and 'GER_Schwieder' maps if location is no grassland
+            in first year with map (default is False).
+        map_data (tuple): Raw management data, query protocol and map properties already read from map, e.g. by
+            get_GER_Lange_data_for_locations (default is None, map is read if not provided).
+        max_workers (int): Maximum number of 'GER_Lange' and 'GER_Schwieder' map files read in parallel (default is 8).
     """
-    if "lat" in coordinates and "lon" in coordinates:
+    if isinstance(coordinates, dict) and "lat" in coordinates and "lon" in coordinates:
         logger.info(
             f"Preparing management data for latitude: {coordinates['lat']}, longitude: {coordinates['lon']} ..."
         )
@@ -1408,13 +1581,23 @@ def get_management_data(
             coordinates["lat"], coordinates["lon"], log_info=True
         )
 
-    if map_key == "GER_Lange":
+    if map_data is not None:
+        management_data_raw, data_query_protocol, map_properties = map_data
+    elif map_key == "GER_Lange":
         management_data_raw, data_query_protocol, map_properties = get_GER_Lange_data(
-            coordinates, years
+            coordinates,
+            years,
+            strict_grassland=strict_grassland,
+            max_workers=max_workers,
         )
     elif map_key == "GER_Schwieder":
         management_data_raw, data_query_protocol, map_properties = (
-            get_GER_Schwieder_data(coordinates, years)
+            get_GER_Schwieder_data(
+                coordinates,
+                years,
+                strict_grassland=strict_grassland,
+                max_workers=max_workers,
+            )
         )
     elif map_key == "EUR_hda_mowing":
         management_data_raw, data_query_protocol, map_properties = (
@@ -1478,6 +1661,9 @@ def prep_management_data(
     elevation_limit=2000,
     deims_id=None,
     file_name=None,
+    strict_grassland=False,
+    map_data=None,
+    max_workers=8,
 ):
     """
     Prepare management data to be used as grassland model input.
@@ -1491,9 +1677,14 @@ def prep_management_data(
         elevation_limit (int): Elevation limit (in meters) above which no management events are assumed (default is 2000).
         deims_id (str): DEIMS.iD (default is None).
         file_name (str or Path): File name to save management data (default is None, default file name used if not provided).
+        strict_grassland (bool): Skip all years of 'GER_Lange' and 'GER_Schwieder' maps if location is no grassland
+            in first year with map (default is False).
+        map_data (tuple): Raw management data, query protocol and map properties already read from map, e.g. by
+            get_GER_Lange_data_for_locations (default is None, map is read if not provided).
+        max_workers (int): Maximum number of parallel map reads or locations (default is 8).
     """
     if years is None:
-        years = list(range(2013, 2024))  # list(range(2017, 2019))
+        years = range(2013, 2024)  # range(2017, 2019)
 
     if coordinates:
         get_management_data(
@@ -1504,6 +1695,9 @@ def prep_management_data(
             mow_height=mow_height,
             elevation_limit=elevation_limit,
             file_name=file_name,
+            strict_grassland=strict_grassland,
+            map_data=map_data,
+            max_workers=max_workers,
         )
     elif deims_id:
         location = ut.get_deims_coordinates(deims_id)
@@ -1517,6 +1711,9 @@ def prep_management_data(
                 mow_height=mow_height,
                 elevation_limit=elevation_limit,
                 file_name=file_name,
+                strict_grassland=strict_grassland,
+                map_data=map_data,
+                max_workers=max_workers,
             )
         else:
             try:
@@ -1586,7 +1783,18 @@ def prep_management_data(
             {"lat": 30, "lon": 1},  # out of Europe
         ]
 
-        for location in locations:
+        if map_key == "GER_Lange":
+            # Read each map file only once for all locations
+            map_data_per_location = get_GER_Lange_data_for_locations(
+                locations,
+                years,
+                strict_grassland=strict_grassland,
+                max_workers=max_workers,
+            )
+        else:
+            map_data_per_location = [None] * len(locations)
+
+        def _get_location_management_data(location, location_map_data):
             get_management_data(
                 location,
                 years,
@@ -1595,6 +1803,20 @@ def prep_management_data(
                 mow_height=mow_height,
                 elevation_limit=elevation_limit,
                 file_name=file_name,
+                strict_grassland=strict_grassland,
+                map_data=location_map_data,
+                max_workers=1,
+            )
+
+        # Locations are independent, overlap their map requests (map files per location read one by one),
+        # except for HDA maps, where locations share tiles and requests are serialized anyway
+        with ThreadPoolExecutor(
+            max_workers=1 if map_key == "EUR_hda_mowing" else max_workers
+        ) as executor:
+            list(
+                executor.map(
+                    _get_location_management_data, locations, map_data_per_location
+                )
             )
 
 
@@ -1641,6 +1863,11 @@ def main():
     )
     parser.add_argument("--deims_id", type=int, help="DEIMS.iD")
     parser.add_argument("--file_name", help="File name to save final management data")
+    parser.add_argument(
+        "--strict_grassland",
+        action="store_true",
+        help="Skip all years of 'GER_Lange' and 'GER_Schwieder' maps if location is no grassland in first year with map.",
+    )
     args = parser.parse_args()
     prep_management_data(
         coordinates=args.coordinates,
@@ -1651,6 +1878,7 @@ def main():
         elevation_limit=args.elevation_limit,
         deims_id=args.deims_id,
         file_name=args.file_name,
+        strict_grassland=args.strict_grassland,
     )
 
 
@@ -35,11 +35,17 @@ Data source:
 import argparse
 import calendar
 import csv
+import importlib.util
+import json
+import tempfile
+import threading
 import time
 import xml.etree.ElementTree as ET
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 import deims
 import numpy as np
@@ -55,6 +61,33 @@ from ucgrassland.logger_config import logger
 # will be "https://opendap.biodt.eu/..."
 OPENDAP_ROOT = "http://opendap.biodt.eu/grasslands-pdt/"
 NOT_FOUND_DEFAULT_STRING = "not found"
+# use fast Rust-based Excel reader if available (pandas engine since 2.2), pandas default engine otherwise
+EXCEL_ENGINE = (
+    "calamine"
+    if importlib.util.find_spec("python_calamine")
+    and tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2)
+    else None
+)
+# use fast JSON parser if available, standard library parser otherwise
+ORJSON = (
+    importlib.import_module("orjson") if importlib.util.find_spec("orjson") else None
+)
+
+# category mappings read from legend files, keys are (file name, modification time)
+category_mapping_cache = {}
+
+# HTTP sessions per thread to reuse connections (keep-alive), retries are handled per request
+http_sessions = threading.local()
+
+# GDAL options for reading remote rasters, skip directory listing and HEAD requests on open
+# (file metadata and read ranges of remote files are cached by GDAL across openings)
+GDAL_REMOTE_RASTER_OPTIONS = MappingProxyType(
+    {
+        "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+        "CPL_VSIL_CURL_USE_HEAD": "NO",
+        "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    }
+)
 
 
 def add_string_to_file_name(file_name, string_to_add, *, new_suffix=None):
@@ -579,8 +612,14 @@ def list_to_file(list_to_write, file_name, *, column_names=None):
     Path(file_name).parent.mkdir(parents=True, exist_ok=True)
 
     if file_suffix in [".txt", ".csv"]:
+        # Large write buffer, each file is written in few system calls
         with open(
-            file_path, "w", newline="", encoding="utf-8", errors="replace"
+            file_path,
+            "w",
+            buffering=1 << 16,
+            newline="",
+            encoding="utf-8",
+            errors="replace",
         ) as file:
             writer = (
                 csv.writer(file, delimiter="\t")
@@ -591,8 +630,7 @@ def list_to_file(list_to_write, file_name, *, column_names=None):
             if column_names is not None:
                 writer.writerow(column_names)  # Header row
 
-            for entry in list_to_write:
-                writer.writerow(entry)
+            writer.writerows(list_to_write)
     elif file_suffix == ".xlsx":
         df = pd.DataFrame(list_to_write, columns=column_names)
         df.to_excel(file_path, index=False)
@@ -1158,13 +1196,7 @@ def get_deims_coordinates(deims_id):
         )
     else:
         try:
-            deims_gdf = deims.getSiteCoordinates(deims_id, filename=None)
-            # option: collect all coordinates from deims_gdf.boundary[0] ...
-            # deims_gdf = deims.getSiteBoundaries(deims_id, file_name=None)
-
-            lon = deims_gdf.geometry[0].x
-            lat = deims_gdf.geometry[0].y
-            name = deims_gdf.name[0]
+            lat, lon, name = get_deims_site_coordinates(deims_id)
             logger.info(
                 f"Coordinates for DEIMS.iD '{deims_id}' found ({name}). "
                 f"Latitude: {lat}, longitude: {lon}."
@@ -1182,6 +1214,38 @@ def get_deims_coordinates(deims_id):
     return {"deims_id": deims_id, "found": False}
 
 
+@lru_cache(maxsize=4096)
+def get_deims_site_coordinates(deims_id):
+    """
+    Request centroid coordinates and name of a DEIMS site, results are cached per DEIMS.iD.
+
+    Parameters:
+        deims_id (str): DEIMS.iD.
+
+    Returns:
+        tuple: Site latitude (float), longitude (float) and name (str).
+    """
+    deims_gdf = deims.getSiteCoordinates(deims_id, filename=None)
+    # option: collect all coordinates from deims_gdf.boundary[0] ...
+    # deims_gdf = deims.getSiteBoundaries(deims_id, file_name=None)
+
+    return deims_gdf.geometry[0].y, deims_gdf.geometry[0].x, deims_gdf.name[0]
+
+
+@lru_cache(maxsize=4096)
+def get_deims_site_record(deims_id):
+    """
+    Request DEIMS site record, results are cached per DEIMS.iD.
+
+    Parameters:
+        deims_id (str): DEIMS.iD.
+
+    Returns:
+        dict: DEIMS site record (not to be modified, as shared between calls).
+    """
+    return deims.getSiteById(deims_id)
+
+
 def get_deims_ids_from_xls(xls_file, header_row, country="ALL"):
     """
     Extract DEIMS IDs from an Excel file and return as a list of dictionaries.
@@ -1202,7 +1266,7 @@ def get_deims_ids_from_xls(xls_file, header_row, country="ALL"):
             raise
 
     # Load Excel file into a DataFrame
-    df = pd.read_excel(xls_file, header=header_row)
+    df = pd.read_excel(xls_file, header=header_row, engine=EXCEL_ENGINE)
 
     # Filter by country code
     if country != "ALL":
@@ -1486,37 +1550,45 @@ def get_unique_keys(
     Returns:
         list: List of unique keys.
     """
-    unique_keys = []
-
-    for d in list_of_dicts:
-        for key in d.keys():
-            if key not in unique_keys:
-                unique_keys.append(key)
+    # Use dict keys for hashed lookup, keeps order of first occurrence
+    unique_keys = dict.fromkeys(key for d in list_of_dicts for key in d)
 
-    return unique_keys
+    return list(unique_keys)
 
 
-def reproject_coordinates(lat, lon, target_crs):
+@lru_cache(maxsize=32)
+def get_transformer(target_crs):
     """
-    Reproject latitude and longitude coordinates to a target CRS.
+    Get transformer from lat/lon coordinates to a target CRS, cached per target CRS.
 
     Parameters:
-        lat (float): Latitude.
-        lon (float): Longitude.
         target_crs (crs or str): Target CRS (as CRS object or str).
 
     Returns:
-        tuple (float): Reprojected coordinates (easting, northing).
+        pyproj.Transformer: Transformer from EPSG:4326 to target CRS.
     """
     # Define the source CRS (EPSG:4326 - WGS 84, commonly used for lat/lon)
     src_crs = "EPSG:4326"
 
     # Create a transformer to convert from the source CRS to the target CRS
     # (always_xy: use lon/lat for source CRS and east/north for target CRS)
-    transformer = pyproj.Transformer.from_crs(src_crs, target_crs, always_xy=True)
+    return pyproj.Transformer.from_crs(src_crs, target_crs, always_xy=True)
+
+
+def reproject_coordinates(lat, lon, target_crs):
+    """
+    Reproject latitude and longitude coordinates to a target CRS.
 
+    Parameters:
+        lat (float or array-like): Latitude(s).
+        lon (float or array-like): Longitude(s).
+        target_crs (crs or str): Target CRS (as CRS object or str).
+
+    Returns:
+        tuple (float): Reprojected coordinates (easting, northing).
+    """
     # Reproject the coordinates (order is lon, lat!)
-    east, north = transformer.transform(lon, lat)
+    east, north = get_transformer(target_crs).transform(lon, lat)
 
     return east, north
 
@@ -1541,9 +1613,58 @@ def set_no_data_value(tif_file, no_data_value):
             )
 
 
-def extract_raster_value(
+def read_raster_values(src, east, north, *, band_number=1):
+    """
+    Read values from an open raster dataset at multiple points, reading each raster block only once.
+
+    Parameters:
+        src (rasterio.io.DatasetReader): Open raster dataset.
+        east (array-like): Easting coordinates of points in raster CRS.
+        north (array-like): Northing coordinates of points in raster CRS.
+        band_number (int): Band number for which the values shall be extracted (default is 1).
+
+    Returns:
+        list: Extracted values, no-data value (or 0 if not set) for points outside the raster.
+    """
+    fill_value = src.nodata if src.nodata is not None else 0
+    values = [fill_value] * len(east)
+    block_height, block_width = src.block_shapes[band_number - 1]
+    points_per_block = defaultdict(list)
+
+    # Get pixel rows and columns of all points via inverse affine transform
+    inverse_transform = ~src.transform
+    east = np.asarray(east, dtype=float)
+    north = np.asarray(north, dtype=float)
+    cols = np.floor(
+        inverse_transform.a * east + inverse_transform.b * north + inverse_transform.c
+    ).astype(np.int64)
+    rows = np.floor(
+        inverse_transform.d * east + inverse_transform.e * north + inverse_transform.f
+    ).astype(np.int64)
+    inside = (rows >= 0) & (rows < src.height) & (cols >= 0) & (cols < src.width)
+
+    # Group points inside the raster by raster block containing them
+    for point_index in np.flatnonzero(inside):
+        row, col = rows[point_index], cols[point_index]
+        points_per_block[(row // block_height, col // block_width)].append(
+            (point_index, row % block_height, col % block_width)
+        )
+
+    # Read each block once, get values for all points within the block
+    for (block_row, block_col), block_points in points_per_block.items():
+        block_data = src.read(
+            band_number, window=src.block_window(band_number, block_row, block_col)
+        )
+
+        for point_index, row, col in block_points:
+            values[point_index] = block_data[row, col]
+
+    return values
+
+
+def extract_raster_values(
     tif_file,
-    location,
+    locations,
     *,
     band_number=1,
     attempts=5,
@@ -1552,19 +1673,19 @@ def extract_raster_value(
     file_date_for_time_stamp=True,
 ):
     """
-    Extract value from raster file at specified coordinates.
+    Extract values from raster file at multiple locations, opening the file only once.
 
     Parameters:
         tif_file (str): TIF file path or URL.
-        coordinates (dict): Dictionary with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
-        band_number (int): Band number for which the value shall be extracted (default is 1).
+        locations (list): List of dictionaries with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
+        band_number (int): Band number for which the values shall be extracted (default is 1).
         attempts (int): Number of attempts to open the TIF file in case of errors (default is 5).
         delay (int): Number of seconds to wait between attempts (default is 2).
         no_data_value (int or float): Value to set as no-data value in the raster file (default is None).
         file_date_for_time_stamp (bool): Use file date for the time stamp (default is True, if False file read time used).
 
     Returns:
-        tuple: Extracted value (None if extraction failed), and time stamp.
+        tuple: List of extracted values (all None if extraction failed), and time stamp.
     """
     is_url = str(tif_file).startswith("http") or str(tif_file).startswith("/vsicurl")
 
@@ -1575,7 +1696,10 @@ def extract_raster_value(
         time_stamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
         try:
-            with rasterio.open(tif_file, "r") as src:
+            with (
+                rasterio.Env(**GDAL_REMOTE_RASTER_OPTIONS),
+                rasterio.open(tif_file, "r") as src,
+            ):
                 # Check if band number exists in the raster file
                 if band_number not in src.indexes:
                     try:
@@ -1586,15 +1710,28 @@ def extract_raster_value(
                         logger.error(e)
                         raise
 
-                # Reproject coordinates to target CRS
+                # Reproject coordinates of all locations to target CRS
                 east, north = reproject_coordinates(
-                    location["lat"],
-                    location["lon"],
+                    np.fromiter(
+                        (location["lat"] for location in locations),
+                        dtype=float,
+                        count=len(locations),
+                    ),
+                    np.fromiter(
+                        (location["lon"] for location in locations),
+                        dtype=float,
+                        count=len(locations),
+                    ),
                     src.crs,  # TIF file CRS
                 )
 
-                # Extract value from specified band number at specified coordinates
-                value = next(src.sample([(east, north)], indexes=band_number))[0]
+                # Extract values from specified band number at specified coordinates
+                values = read_raster_values(
+                    src,
+                    np.atleast_1d(east),
+                    np.atleast_1d(north),
+                    band_number=band_number,
+                )
 
                 if file_date_for_time_stamp:
                     if is_url:
@@ -1606,7 +1743,125 @@ def extract_raster_value(
 
                     # Code for trying to use tifftag_datetime in commits before 2025-08-12 (but tag never found)
 
-            return value, time_stamp
+            return values, time_stamp
+        except rasterio.errors.RasterioIOError as e:
+            attempts -= 1
+            logger.error(f"Reading TIF file failed ({e}).")
+
+            if attempts > 0:
+                logger.info(f"Retrying in {delay} seconds ...")
+                time.sleep(delay)
+            else:
+                return [None] * len(locations), time_stamp
+
+
+def extract_raster_value(
+    tif_file,
+    location,
+    *,
+    band_number=1,
+    attempts=5,
+    delay=2,
+    no_data_value=None,
+    file_date_for_time_stamp=True,
+):
+    """
+    Extract value from raster file at specified coordinates.
+
+    Parameters:
+        tif_file (str): TIF file path or URL.
+        coordinates (dict): Dictionary with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
+        band_number (int): Band number for which the value shall be extracted (default is 1).
+        attempts (int): Number of attempts to open the TIF file in case of errors (default is 5).
+        delay (int): Number of seconds to wait between attempts (default is 2).
+        no_data_value (int or float): Value to set as no-data value in the raster file (default is None).
+        file_date_for_time_stamp (bool): Use file date for the time stamp (default is True, if False file read time used).
+
+    Returns:
+        tuple: Extracted value (None if extraction failed), and time stamp.
+    """
+    values, time_stamp = extract_raster_values(
+        tif_file,
+        [location],
+        band_number=band_number,
+        attempts=attempts,
+        delay=delay,
+        no_data_value=no_data_value,
+        file_date_for_time_stamp=file_date_for_time_stamp,
+    )
+
+    return values[0], time_stamp
+
+
+def extract_raster_band_values(
+    tif_file,
+    location,
+    *,
+    band_numbers=None,
+    attempts=5,
+    delay=2,
+    file_date_for_time_stamp=True,
+):
+    """
+    Extract values of multiple bands from raster file at specified coordinates, opening the file only once.
+
+    Parameters:
+        tif_file (str): TIF file path or URL.
+        location (dict): Dictionary with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
+        band_numbers (list of int): Band numbers for which the values shall be extracted (default is None, all bands).
+        attempts (int): Number of attempts to open the TIF file in case of errors (default is 5).
+        delay (int): Number of seconds to wait between attempts (default is 2).
+        file_date_for_time_stamp (bool): Use file date for the time stamp (default is True, if False file read time used).
+
+    Returns:
+        tuple: List of extracted values per band (None if extraction failed), and time stamp.
+    """
+    is_url = str(tif_file).startswith("http") or str(tif_file).startswith("/vsicurl")
+
+    while attempts > 0:
+        time_stamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+        try:
+            with (
+                rasterio.Env(**GDAL_REMOTE_RASTER_OPTIONS),
+                rasterio.open(tif_file, "r") as src,
+            ):
+                if band_numbers is None:
+                    band_numbers = list(src.indexes)
+
+                # Check if band numbers exist in the raster file
+                missing_bands = [b for b in band_numbers if b not in src.indexes]
+
+                if missing_bands:
+                    try:
+                        raise ValueError(
+                            f"Band number(s) {missing_bands} do not exist in the raster file {tif_file}."
+                        )
+                    except ValueError as e:
+                        logger.error(e)
+                        raise
+
+                # Reproject coordinates to target CRS
+                east, north = reproject_coordinates(
+                    location["lat"], location["lon"], src.crs
+                )
+
+                # Extract values from all bands with one read of the pixel
+                values = list(
+                    next(
+                        src.sample([(east, north)], indexes=band_numbers, masked=False)
+                    )
+                )
+
+                if file_date_for_time_stamp:
+                    if is_url:
+                        logger.warning(
+                            "Cannot access file modification time for URL. Using file reading time instead."
+                        )
+                    else:
+                        time_stamp = get_file_date(tif_file)
+
+            return values, time_stamp
         except rasterio.errors.RasterioIOError as e:
             attempts -= 1
             logger.error(f"Reading TIF file failed ({e}).")
@@ -1615,7 +1870,7 @@ def extract_raster_value(
                 logger.info(f"Retrying in {delay} seconds ...")
                 time.sleep(delay)
             else:
-                return None, time_stamp
+                return [None] * len(band_numbers or [None]), time_stamp
 
 
 def check_url(url, *, attempts=5, delay_exponential=2, delay_linear=2):
@@ -1641,7 +1896,7 @@ def check_url(url, *, attempts=5, delay_exponential=2, delay_linear=2):
         attempts -= 1
 
         try:
-            response = requests.head(url, allow_redirects=True, timeout=30)
+            response = get_http_session().head(url, allow_redirects=True, timeout=30)
 
             if response.status_code == 200:
                 return response.url
@@ -1676,6 +1931,32 @@ def check_url(url, *, attempts=5, delay_exponential=2, delay_linear=2):
     return None
 
 
+def get_http_session():
+    """
+    Get HTTP session of the current thread, create it on first use.
+
+    Requests sessions are not thread-safe, so each thread reuses its own connections.
+
+    Returns:
+        requests.Session: HTTP session of the current thread.
+    """
+    session = getattr(http_sessions, "session", None)
+
+    if session is None:
+        session = requests.Session()
+        session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32),
+        )
+        session.mount(
+            "http://",
+            requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32),
+        )
+        http_sessions.session = session
+
+    return session
+
+
 def download_file_opendap(
     file_name,
     opendap_folder,
@@ -1708,7 +1989,7 @@ def download_file_opendap(
 
     while attempts > 0:
         try:
-            response = requests.get(url, timeout=30)
+            response = get_http_session().get(url, timeout=30)
 
             # # Variant with authentication using OPeNDAP credentials from .env file.
             # dotenv_config = dotenv_values(".env")
@@ -1723,9 +2004,19 @@ def download_file_opendap(
                 target_file = target_folder / new_file_name
                 Path(target_file).parent.mkdir(parents=True, exist_ok=True)
 
-                with open(target_file, "wb") as file:
+                # Write to temporary file and move it into place, as parallel processes
+                # can download or read the same file
+                with tempfile.NamedTemporaryFile(
+                    "wb",
+                    dir=Path(target_file).parent,
+                    prefix=f"{Path(target_file).name}.",
+                    suffix=".part",
+                    delete=False,
+                ) as file:
                     file.write(response.content)
 
+                Path(file.name).replace(target_file)
+
                 if log_infos:
                     logger.info(f"File downloaded successfully to '{target_file}'.")
 
@@ -1771,6 +2062,29 @@ def day_of_year_to_date(year, day_of_year, leap_year_considered=True):
     return datetime(year, 1, 1) + timedelta(days=delta_days)
 
 
+def days_of_year_to_date_strings(year, days_of_year, leap_year_considered=True):
+    """
+    Convert days of a year to corresponding date strings, all days at once.
+
+    Args:
+        year (int): Year.
+        days_of_year (list of int): Days of year (count from 1 for January 1st).
+        leap_year_considered (bool): Days of year correctly account for leap year (default is True).
+
+    Returns:
+        list of str: Corresponding dates in format YYYY-MM-DD.
+    """
+    days_of_year = np.asarray(days_of_year, dtype=int)
+
+    # Adjust days after Feb 29 for leap year, if not correct already
+    if (not leap_year_considered) and calendar.isleap(year):
+        days_of_year = days_of_year + (days_of_year > 59)
+
+    dates = np.datetime64(f"{year}-01-01") + (days_of_year - 1).astype("timedelta64[D]")
+
+    return dates.astype(str).tolist()
+
+
 def get_legend_from_file(map_specs, *, cache=None):
     """
     Get legend file for land cover map and create a mapping of category indices to category names.
@@ -1790,7 +2104,7 @@ def get_legend_from_file(map_specs, *, cache=None):
 
         if leg_file.is_file():
             logger.info(f"Land cover categories found. Using '{leg_file}'.")
-            category_mapping = create_category_mapping(leg_file)
+            category_mapping = get_category_mapping(leg_file)
 
             return category_mapping
         else:
@@ -1803,7 +2117,7 @@ def get_legend_from_file(map_specs, *, cache=None):
 
     if check_url(leg_file):
         logger.info(f"Land cover categories found. Using '{leg_file}'.")
-        category_mapping = create_category_mapping(leg_file)
+        category_mapping = get_category_mapping(leg_file)
 
         return category_mapping
     else:
@@ -1816,6 +2130,33 @@ def get_legend_from_file(map_specs, *, cache=None):
             raise
 
 
+def get_category_mapping(leg_file):
+    """
+    Get a mapping of category indices to category names from legend file,
+    reusing the mapping if the same legend file (unchanged for local files) was read before.
+
+    Parameters:
+        leg_file (Path or URL): Path or URL to the leg file containing category names (in specific format).
+
+    Returns:
+        dict: A mapping of category indices to category names.
+    """
+    modification_time = (
+        leg_file.stat().st_mtime_ns if isinstance(leg_file, Path) else None
+    )
+    cache_key = (str(leg_file), modification_time)
+    category_mapping = category_mapping_cache.get(cache_key)
+
+    if category_mapping is None:
+        category_mapping = create_category_mapping(leg_file)
+
+        # Only keep successfully read mappings, retry reading otherwise
+        if category_mapping:
+            category_mapping_cache[cache_key] = category_mapping
+
+    return dict(category_mapping)
+
+
 def create_category_mapping(leg_file):
     """
     Create a mapping of category indices to category names from legend file (XML or XLSX or ...).
@@ -1836,10 +2177,9 @@ def create_category_mapping(leg_file):
 
     if leg_file_suffix in ["xlsx", "xls"]:
         try:
-            df = pd.read_excel(leg_file)
-
             # Assuming category elements are listed in the first two columns (index and name)
-            category_mapping = {row[0]: row[1] for row in df.values}
+            df = pd.read_excel(leg_file, usecols=[0, 1], engine=EXCEL_ENGINE)
+            category_mapping = dict(zip(df.iloc[:, 0].tolist(), df.iloc[:, 1].tolist()))
             # # Alternative using the row names 'code' and 'class_name'
             # category_mapping = (df[["code", "class_name"]].set_index("code")["class_name"].to_dict())
         except Exception as e:
@@ -1875,6 +2215,22 @@ def create_category_mapping(leg_file):
     return category_mapping
 
 
+def parse_json(content):
+    """
+    Parse JSON content, e.g. of a request response, using orjson if available.
+
+    Parameters:
+        content (bytes or str): JSON content.
+
+    Returns:
+        dict or list: Parsed JSON data.
+    """
+    if ORJSON is not None:
+        return ORJSON.loads(content)
+
+    return json.loads(content)
+
+
 def get_country(coordinates, *, attempts=5, delay_exponential=2, delay_linear=2):
     """
     Get country code for specified coordinates.
@@ -1892,7 +2248,7 @@ def get_country(coordinates, *, attempts=5, delay_exponential=2, delay_linear=2)
         attempts -= 1
 
         try:
-            response = requests.get(
+            response = get_http_session().get(
                 "https://nominatim.openstreetmap.org/reverse",
                 params={
                     "lat": coordinates["lat"],
@@ -1962,7 +2318,7 @@ def get_elevation(
         attempts -= 1
 
         try:
-            response = requests.get(
+            response = get_http_session().get(
                 "https://api.open-elevation.com/api/v1/lookup",
                 params={"locations": f"{lat},{lon}"},
                 timeout=30,
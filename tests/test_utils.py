@@ -20,10 +20,15 @@ from pathlib import Path
 import numpy as np
 import pyproj
 import pytest
+import rasterio
+from rasterio.transform import from_origin
 
 from ucgrassland.utils import (
     add_string_to_file_name,
+    day_of_year_to_date,
+    days_of_year_to_date_strings,
     download_file_opendap,
+    extract_raster_values,
     get_source_from_elter_data_file_name,
     get_tuple_list,
     replace_substrings,
@@ -322,6 +327,76 @@ def test_reproject_coordinates():
             )
 
 
+def test_days_of_year_to_date_strings():
+    """Test days_of_year_to_date_strings function against day_of_year_to_date."""
+    days_of_year = [1, 59, 60, 61, 200, 365]
+
+    for year in [2019, 2020]:
+        for leap_year_considered in [True, False]:
+            expected_dates = [
+                day_of_year_to_date(year, day, leap_year_considered).strftime(
+                    "%Y-%m-%d"
+                )
+                for day in days_of_year
+            ]
+
+            assert (
+                days_of_year_to_date_strings(year, days_of_year, leap_year_considered)
+                == expected_dates
+            )
+
+    assert days_of_year_to_date_strings(2020, [60, 366]) == ["2020-02-29", "2020-12-31"]
+    assert days_of_year_to_date_strings(2020, []) == []
+
+
+def test_extract_raster_values(tmp_path):
+    """Test extract_raster_values function."""
+    # Create tiled raster file in EPSG:4326 with 1 degree per pixel
+    tif_file = tmp_path / "test_raster.tif"
+    data = np.arange(64 * 64, dtype=np.int32).reshape(64, 64)
+
+    with rasterio.open(
+        tif_file,
+        "w",
+        driver="GTiff",
+        height=64,
+        width=64,
+        count=1,
+        dtype="int32",
+        crs="EPSG:4326",
+        transform=from_origin(0, 64, 1, 1),
+        tiled=True,
+        blockxsize=16,
+        blockysize=16,
+        nodata=-1,
+    ) as dst:
+        dst.write(data, 1)
+
+    # Locations in different blocks, same block, and outside the raster
+    locations = [
+        {"lat": 63.5, "lon": 0.5},
+        {"lat": 40.5, "lon": 20.5},
+        {"lat": 40.2, "lon": 21.7},
+        {"lat": 0.5, "lon": 63.5},
+        {"lat": 70.0, "lon": 10.0},
+    ]
+    values, _ = extract_raster_values(
+        tif_file, locations, file_date_for_time_stamp=False
+    )
+
+    with rasterio.open(tif_file) as src:
+        expected_values = [
+            value[0]
+            for value in src.sample(
+                [(location["lon"], location["lat"]) for location in locations]
+            )
+        ]
+
+    assert values == expected_values
+    assert values[:4] == [0, 23 * 64 + 20, 23 * 64 + 21, 63 * 64 + 63]
+    assert values[4] == -1
+
+
 def test_download_file_opendap(tmp_path, caplog):
     """Test download of a file from the OPeNDAP server."""
     # Create a temporary file name and download